@@ -1,19 +1,80 @@
-from .base import BaseFrame, Request, Direction
-from .slider import SlideFrame
-from .resizable import ResizableFrame
-from .enums import SlideDirection, Axis, Orientation, Direction
+import importlib
+from typing import TYPE_CHECKING
+from .enums import SlideDirection, Axis, Orientation, Direction, Easing, Priority
+
+if TYPE_CHECKING:
+    from .base import BaseFrame, Request
+    from .clock import FrameClock
+    from .stats import AnimationStats, FrameSample, RequestTiming
+    from .slider import SlideFrame
+    from .resizable import ResizableFrame
+    from .canvas import CanvasSlideFrame
+    from .property import PropertyFrame
+    from .spring import Spring
+    from .timeline import Timeline, Parallel, Sequence, Stagger
+
+
+# Widgets are imported on first access so that `import anitk` (or `anitk.enums`)
+# does not pay for importing customtkinter.
+_LAZY_ATTRIBUTES = {
+    "BaseFrame": "base",
+    "Request": "base",
+    "FrameClock": "clock",
+    "AnimationStats": "stats",
+    "FrameSample": "stats",
+    "RequestTiming": "stats",
+    "SlideFrame": "slider",
+    "ResizableFrame": "resizable",
+    "CanvasSlideFrame": "canvas",
+    "PropertyFrame": "property",
+    "Spring": "spring",
+    "Timeline": "timeline",
+    "Parallel": "timeline",
+    "Sequence": "timeline",
+    "Stagger": "timeline",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
-    "BaseFrame", 
-    "Request", 
+    "BaseFrame",
+    "Request",
+    "FrameClock",
+    "AnimationStats",
+    "FrameSample",
+    "RequestTiming",
 
     "SlideFrame",
 
     "ResizableFrame",
 
+    "CanvasSlideFrame",
+
+    "PropertyFrame",
+
+    "Spring",
+
+    "Timeline",
+    "Parallel",
+    "Sequence",
+    "Stagger",
+
     "SlideDirection",
     "Axis",
     "Orientation",
-    "Direction"
+    "Direction",
+    "Easing",
+    "Priority",
 ]
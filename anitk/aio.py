@@ -0,0 +1,52 @@
+import asyncio
+import logging
+import tkinter
+from typing import Any, Awaitable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_INTERVAL = 5
+
+
+async def mainloop(root: tkinter.Misc, interval: float = DEFAULT_INTERVAL) -> None:
+    """
+    Process `root`'s Tk events from the running asyncio loop, every `interval`
+    ms, until the root is destroyed. Animation futures (see
+    `BaseFrame.forward`) are resolved from here, so coroutines awaiting them
+    resume on the same loop.
+    """
+    while True:
+        try:
+            root.update()
+        except tkinter.TclError:
+            # The application has been destroyed.
+            return
+        await asyncio.sleep(interval / 1000)
+
+
+def run(root: tkinter.Misc, main: Optional[Awaitable[Any]] = None, interval: float = DEFAULT_INTERVAL) -> Any:
+    """
+    Like `root.mainloop()`, but with an asyncio loop running alongside Tk.
+    `main` runs as a task until it returns or the root is destroyed, whichever
+    comes first; its result (or exception) is returned (raised) at the end.
+    """
+    return asyncio.run(_run(root, main, interval))
+
+
+async def _run(root: tkinter.Misc, main: Optional[Awaitable[Any]], interval: float) -> Any:
+    if main is None:
+        await mainloop(root, interval)
+        return None
+    task = asyncio.ensure_future(main)
+    try:
+        await mainloop(root, interval)
+    finally:
+        if task.done() is False:
+            logger.debug("root destroyed, cancelling %r", task)
+            task.cancel()
+    try:
+        return await task
+    except asyncio.CancelledError:
+        return None
@@ -1,14 +1,26 @@
+import itertools
 import logging
-from typing import Optional
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from abc import abstractmethod, ABC
 from customtkinter import CTkFrame as Frame
-from actkinter.enums import Direction
+from anitk.clock import FrameClock, Scheduler
+from anitk.easing import compile_frames, get_frame_count
+from anitk.enums import Direction, Easing, Priority
+from anitk.geometry import Visibility
+from anitk.spring import Spring, SpringMotion
+from anitk.stats import AnimationStats, FrameSample, Instrument, RequestTiming
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 logger = logging.getLogger(__name__)
 
 
 class BaseRequest:
+    __slots__ = ("terminated", "interrupt")
+
     def __init__(
         self,
         terminated: bool = False,
@@ -18,12 +30,52 @@ class BaseRequest:
         self.interrupt = interrupt
 
 class Request(BaseRequest):
+    __slots__ = ("direction", "start_time", "duration", "interval", "steps", "last_frame", "future", "generation")
+
+    POOL_SIZE = 64
+    _pool: List["Request"] = []
+    # Pooled requests are reused: the generation tells one use from the next.
+    _generations = itertools.count()
+
     def __init__(self, direction: Direction, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.direction = direction
+        self.start_time = 0.0
+        self.duration = 0.0
+        self.interval = 0
+        self.steps = 0
+        self.last_frame = 0.0
+        self.future: Optional["asyncio.Future[bool]"] = None
+        self.generation = next(Request._generations)
+
+    @classmethod
+    def acquire(cls, direction: Direction) -> "Request":
+        """ A fresh request, recycled from the pool of released ones when possible. """
+        if cls._pool:
+            request = cls._pool.pop()
+            request.__init__(direction)
+            return request
+        return cls(direction)
+
+    def resolve(self, completed: bool) -> None:
+        """ Settle the future handed out for this request, if any. """
+        if self.future is not None:
+            if self.future.done() is False:
+                self.future.set_result(completed)
+            self.future = None
+
+    def release(self) -> None:
+        """ Give the request back to the pool; a pending future was superseded and resolves to False. """
+        self.resolve(False)
+        if len(Request._pool) < Request.POOL_SIZE:
+            Request._pool.append(self)
 
 
 class BaseFrame(Frame, ABC):
+    _geometry_methods: Tuple[str, ...] = ()
+    # Global switch: while set, every animation (running or new) completes at once.
+    low_power = False
+
     def __init__(
         self,
         enable_animation: bool = True,
@@ -33,10 +85,21 @@ class BaseFrame(Frame, ABC):
         override_fps: bool = False,
         offset_precision: int = 6,
         opened: bool = False,
+        duration: Optional[float] = None,
+        easing: Easing = Easing.LINEAR,
+        spring: Optional[Spring] = None,
+        adaptive: bool = False,
+        priority: Priority = Priority.FOREGROUND,
+        instrument: bool = False,
+        on_frame: Optional[Callable[[FrameSample], None]] = None,
+        on_complete: Optional[Callable[[RequestTiming], None]] = None,
+        threadsafe: bool = False,
         *args,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        # Fixed-offset plans per direction (see `_get_plan`).
+        self._plans: Dict[Direction, Any] = {}
         self._opened = opened
         self.enable_animation = enable_animation
         self.ignore_inputs = ignore_inputs
@@ -44,33 +107,69 @@ class BaseFrame(Frame, ABC):
         self.fps_factor = fps_factor
         self.override_fps = override_fps
         self.offset_precision = offset_precision
+        self.duration = duration
+        self.easing = easing
+        # Takes precedence over `duration` and the fixed offsets.
+        self.spring = spring
+        self._springs: Tuple[SpringMotion, ...] = ()
+        self._spring_elapsed = 0.0
+        self.adaptive = adaptive
+        # What the clock sacrifices first once its `budget` is spent (see `Scheduler`).
+        self.priority = priority
+        if instrument is True or on_frame is not None or on_complete is not None:
+            self._instrument: Optional[Instrument] = Instrument(self, on_frame, on_complete)
+        else:
+            self._instrument = None
         self._request = Request(
             terminated=True,
             direction=Direction.FORWARD if opened is True else Direction.BACKWARD
         )
         self._next_request: Optional[Request] = None
+        self._scheduler: Optional[Scheduler] = None
+        self._active_scheduler: Optional[Scheduler] = None
+        self._handle: Optional[int] = None
+        self._visibility: Optional[Visibility] = None
+        self._destroyed = False
+        # Lets other threads call `forward_threadsafe` and `backward_threadsafe`.
+        self._threadsafe = threadsafe
+        if threadsafe is True:
+            self.clock.open_mailbox()
+
+    def _get_pending_request(self) -> Request:
+        return self._request if self._next_request is None else self._next_request
 
     def _ignore_request(self, direction: Direction) -> bool:
         return (
             self._request.terminated is False and self.ignore_inputs is True
-            or self._request.direction == direction
+            or self._get_pending_request().direction == direction
         )
 
-    def _put_request(self, direction: Direction) -> None:
-        if self._ignore_request(direction) is False:
-            request = Request(direction)
-            if self.ignore_inputs is True:
-                self._request = request
-                self._do_animation(request)
-            else:
-                self._next_request = request
-                if self._request.terminated is False:
-                    self._request.interrupt = True
-                else:
-                    self._do_next_request()
+    def _put_request(self, direction: Direction) -> Optional[Request]:
+        """ The request that will carry out `direction`, or None if the input was ignored. """
+        if self._ignore_request(direction) is True:
+            pending = self._get_pending_request()
+            return pending if pending.direction == direction else None
+        if self.ignore_inputs is True:
+            request = Request.acquire(direction)
+            self._request.release()
+            self._request = request
+            self._do_animation(request)
+        elif self._request.terminated is False and self._request.direction == direction:
+            # A burst of toggles that ends on the running direction cancels the retarget.
+            self._next_request.release()
+            self._next_request = None
+        else:
+            # A running chain picks the new request up on its next tick (see `_retarget`).
+            if self._next_request is not None:
+                self._next_request.release()
+            self._next_request = Request.acquire(direction)
+            if self._request.terminated is True:
+                self._do_next_request()
+        return self._get_pending_request()
 
     def _do_next_request(self) -> None:
         if self._next_request is not None:
+            self._request.release()
             self._request = self._next_request
             self._next_request = None
             if self._request.direction is Direction.FORWARD:
@@ -79,19 +178,451 @@ class BaseFrame(Frame, ABC):
                 self._forward_animation_reached = False
             self._do_animation(self._request)
 
-    def backward(self) -> None:
-        self._put_request(direction=Direction.BACKWARD)
+    @property
+    def enable_animation(self) -> bool:
+        return self._enable_animation
+
+    @enable_animation.setter
+    def enable_animation(self, value: bool) -> None:
+        self._enable_animation = value
+
+    def _get_plan(self, direction: Direction) -> Any:
+        """ The immutable stepping plan for `direction`, compiled on first use. """
+        plan = self._plans.get(direction)
+        if plan is None:
+            plan = self._plans[direction] = self._compile_plan(direction)
+        return plan
+
+    def _invalidate_plans(self) -> None:
+        self._plans.clear()
+
+    @property
+    def duration(self) -> Optional[float]:
+        return self._duration
+
+    @duration.setter
+    def duration(self, value: Optional[float]) -> None:
+        if value is not None:
+            value = float(value)
+            if value < 0:
+                raise ValueError("'duration' must be a non negative number of milliseconds.")
+        self._duration = value
+
+    @property
+    def easing(self) -> Easing:
+        return self._easing
+
+    @easing.setter
+    def easing(self, value: Easing) -> None:
+        if isinstance(value, Easing) is False:
+            raise TypeError(f"Invalid input type: {type(value)}. Expected input type: Easing")
+        self._easing = value
+
+    @property
+    def spring(self) -> Optional[Spring]:
+        return self._spring
+
+    @spring.setter
+    def spring(self, value: Optional[Spring]) -> None:
+        if value is not None and isinstance(value, Spring) is False:
+            raise TypeError(f"Invalid input type: {type(value)}. Expected input type: Spring")
+        self._spring = value
+
+    @property
+    def priority(self) -> Priority:
+        return self._priority
+
+    @priority.setter
+    def priority(self, value: Priority) -> None:
+        if isinstance(value, Priority) is False:
+            raise TypeError(f"Invalid input type: {type(value)}. Expected input type: Priority")
+        self._priority = value
+        # Tested by the step instead of the enum, whose lookup allocates.
+        self._degradable = value is not Priority.FOREGROUND
+        if self.__dict__.get("_handle") is not None:
+            self._active_scheduler.set_priority(self._handle, value)
+
+    @property
+    def clock(self) -> FrameClock:
+        # A widget never changes interpreter, so the lookup is done once.
+        clock = self.__dict__.get("_clock")
+        if clock is None:
+            clock = self._clock = FrameClock.of(self)
+        return clock
+
+    @property
+    def animating(self) -> bool:
+        return self._request.terminated is False or self._next_request is not None
+
+    @property
+    def destroyed(self) -> bool:
+        return self._destroyed
+
+    @property
+    def stats(self) -> Optional[AnimationStats]:
+        return None if self._instrument is None else self._instrument.stats
+
+    def _get_visibility(self) -> Visibility:
+        if self._visibility is None:
+            self._visibility = Visibility.of(self)
+            self._visibility.subscribe(self._on_visibility)
+        return self._visibility
+
+    def _animation_skipped(self) -> bool:
+        """ Whether requests complete at once: animation is off or nobody would see it. """
+        return (
+            self.enable_animation is False
+            or BaseFrame.low_power is True
+            or self._get_visibility().hides(self)
+        )
+
+    def _on_visibility(self) -> None:
+        if self._handle is not None and self._visibility.hides(self) is True:
+            logger.debug("hidden while animating, completing at once")
+            self._complete_now()
+
+    def _complete_now(self) -> None:
+        """ Show the end of the running chain (its pending request, if any) and stop ticking. """
+        if self._next_request is not None:
+            previous = self._request
+            previous.interrupt = True
+            previous.terminated = True
+            self._request, self._next_request = self._next_request, None
+            previous.release()
+        self._active_scheduler.unregister(self._handle)
+        self._jump(self._request)
+        if self._instrument is not None:
+            self._instrument.close(self._request)
+        self._finish(self._request)
+
+    def _do_animation(self, request: Request) -> None:
+        if self._handle is not None:
+            # At most one chain per frame.
+            self._active_scheduler.unregister(self._handle)
+            self._handle = None
+            if self._instrument is not None:
+                self._instrument.close(request)
+        if self._animation_skipped() is True:
+            self._jump(request)
+            self._finish(request)
+            return
+        self._prepare(request)
+        step = self._step if self._instrument is None else self._instrumented_step
+        self._active_scheduler = self._scheduler or self.clock
+        self._handle = self._active_scheduler.register(
+            step, request.interval, self.adaptive, self.priority, self._complete_now
+        )
+
+    def _prepare(self, request: Request, previous: Optional[Request] = None) -> None:
+        request.start_time = self.clock.now()
+        if self.spring is not None:
+            self._animate = self._spring_animation
+            request.interval = self._get_frame_interval()
+            self._prepare_spring(request, previous)
+            return
+        # Springs only hand their velocity on to springs.
+        self._springs = ()
+        if self.duration is None:
+            self._animate = self._animation
+            self._prepare_steps(request)
+        else:
+            self._animate = self._timed_animation
+            request.interval = self._get_frame_interval()
+            self._prepare_timed(request, previous)
+
+    def _step(self) -> bool:
+        if BaseFrame.low_power is True:
+            self._complete_now()
+            return False
+        if self._next_request is not None:
+            self._retarget()
+        return self._animate(self._request)
+
+    def _instrumented_step(self) -> bool:
+        if BaseFrame.low_power is True:
+            self._complete_now()
+            return False
+        if self._next_request is not None:
+            self._retarget()
+        return self._instrument.step(self._request, self._animate)
+
+    def _retarget(self) -> None:
+        """ Hand the running chain over to the pending request, from the current position and velocity. """
+        previous = self._request
+        previous.interrupt = True
+        previous.terminated = True
+        self._request, self._next_request = self._next_request, None
+        self._prepare(self._request, previous)
+        previous.release()
+        # The current position is already on screen: this tick shows the next one.
+        self._request.start_time -= self._request.interval
+        self._request.steps = 1
+        self._active_scheduler.set_interval(self._handle, self._request.interval)
+
+    def _finish(self, request: Request) -> bool:
+        request.terminated = True
+        request.resolve(True)
+        self._handle = None
+        self._do_next_request()
+        return False
+
+    def _get_frame_interval(self) -> int:
+        return max(1, round(1000 / self.fps))
+
+    def _start_timed_request(self, request: Request, remaining: float) -> None:
+        """ `remaining` is the share of the path left, so a reversal mid-way takes less than `duration`. """
+        request.duration = self.duration * min(1.0, max(0.0, remaining))
+        # A float, so the index arithmetic never builds a large int.
+        request.last_frame = float(get_frame_count(self.fps, request.duration))
 
-    def forward(self) -> None:
-        self._put_request(direction=Direction.FORWARD)
+    def _get_progress(self, request: Request) -> float:
+        if request.duration <= 0:
+            return 1.0
+        progress = (self.clock.now() - request.start_time) / request.duration
+        return progress if progress < 1.0 else 1.0
 
-    def do_animation(self) -> None:
-        match self._request.direction:
+    def _get_owed_steps(self, request: Request) -> int:
+        """ Steps due since the last tick: adaptive and background frames catch up on skipped ticks. """
+        # Counted for every frame, so switching to catching up does not replay the whole request.
+        owed = self._count_due_steps(request, self.clock.now())
+        if self.adaptive is False and self._degradable is False:
+            return 1
+        return owed if owed > 1 else 1
+
+    def _count_due_steps(self, request: Request, now: float) -> int:
+        """ Steps due by `now` and not counted yet; they are counted now. """
+        # Schedulers run steps up to 1 ms early.
+        due = int((now - request.start_time + 1) / request.interval) + 1 - request.steps
+        request.steps += due
+        return due
+
+    def _get_frame_index(self, request: Request) -> int:
+        # Not `round()`, which allocates: progress is never negative.
+        return int(self._get_progress(request) * request.last_frame + 0.5)
+
+    def _compile_frames(
+        self,
+        request: Request,
+        start: float,
+        end: float,
+        previous: Optional[Request] = None,
+        previous_frames: Tuple[float, ...] = (),
+    ) -> Tuple[float, ...]:
+        """ Retargeting from `previous` starts the new path at the velocity it had. """
+        velocity = None
+        if previous is not None and previous.duration > 0 and len(previous_frames) > 1:
+            index = max(1, self._get_frame_index(previous))
+            frame_time = previous.duration / previous.last_frame
+            velocity = round(
+                (previous_frames[index] - previous_frames[index - 1]) / frame_time * request.duration,
+                self.offset_precision,
+            )
+        return compile_frames(
+            start, end, self.fps, request.duration, self.easing, self.offset_precision, velocity
+        )
+
+    def _retarget_frames(self, request: Request, frames: Tuple[float, ...], target: float) -> Tuple[float, ...]:
+        """ `frames` bent to end on `target`, shifting the frames still to come progressively. """
+        index = self._get_frame_index(request)
+        last = len(frames) - 1
+        if index >= last:
+            return frames[:-1] + (target,)
+        shift = target - frames[-1]
+        return frames[:index + 1] + tuple(
+            round(frames[i] + shift * (i - index) / (last - index), self.offset_precision)
+            for i in range(index + 1, last + 1)
+        )
+
+    def _start_springs(
+        self,
+        request: Request,
+        axes: Tuple[Tuple[float, float, float], ...],
+        previous: Optional[Request] = None,
+    ) -> None:
+        """
+        Release one spring per `(start, target, pixel)` axis, keeping the
+        velocities of `previous`; the request lasts until every axis settles
+        within half a pixel.
+        """
+        springs, elapsed = self._springs, self._spring_elapsed
+        carry = previous is not None and len(springs) == len(axes)
+        self._springs = tuple(
+            self.spring.motion(start, target, springs[i].velocity(elapsed) if carry is True else 0.0)
+            for i, (start, target, pixel) in enumerate(axes)
+        )
+        self._spring_elapsed = 0.0
+        request.duration = max(spring.settle_time(pixel / 2) for spring, (_, _, pixel) in zip(self._springs, axes))
+
+    def _get_spring_elapsed(self, request: Request) -> float:
+        elapsed = self._spring_elapsed = self.clock.now() - request.start_time
+        return elapsed
+
+    def backward(self) -> Optional["asyncio.Future[bool]"]:
+        """ See `forward`. """
+        return self._get_future(self._put_request(direction=Direction.BACKWARD))
+
+    def forward(self) -> Optional["asyncio.Future[bool]"]:
+        """
+        Start (or queue) the forward animation. Called from a running asyncio
+        loop, it returns a future that resolves to True once the animation
+        completes and to False if it is superseded or the input is ignored;
+        otherwise it returns None.
+        """
+        return self._get_future(self._put_request(direction=Direction.FORWARD))
+
+    def forward_threadsafe(self) -> None:
+        """
+        `forward` for any thread: the request is queued without touching Tk
+        and carried out by the Tk thread within a frame. Only the latest
+        request queued for a frame in that time counts.
+        """
+        self._post(Direction.FORWARD)
+
+    def backward_threadsafe(self) -> None:
+        """ See `forward_threadsafe`. """
+        self._post(Direction.BACKWARD)
+
+    def _post(self, direction: Direction) -> None:
+        # A worker cannot know when the Tk thread destroys the frame.
+        if self._destroyed is True:
+            return
+        if self._threadsafe is False:
+            raise RuntimeError("Requests from other threads need a frame created with 'threadsafe=True'.")
+        self.clock.post(self, direction)
+
+    def destroy(self) -> None:
+        """
+        Stop the running animation (its futures, and the pending one's,
+        resolve to False) and leave the clock before destroying the widget,
+        so no step ever runs against a dead widget.
+        """
+        if self._destroyed is False:
+            self._destroyed = True
+            if self._handle is not None:
+                self._active_scheduler.unregister(self._handle)
+                self._handle = None
+            self._request.interrupt = True
+            self._request.terminated = True
+            self._request.resolve(False)
+            if self._instrument is not None:
+                self._instrument.close(self._request)
+            if self._next_request is not None:
+                self._next_request.release()
+                self._next_request = None
+            if self._visibility is not None:
+                self._visibility.unsubscribe(self._on_visibility)
+            if self._threadsafe is True:
+                self._threadsafe = False
+                self.clock.close_mailbox()
+        super().destroy()
+
+    def do_animation(self) -> Optional["asyncio.Future[bool]"]:
+        match self._get_pending_request().direction:
             case Direction.BACKWARD:
-                self.forward()
+                return self.forward()
             case Direction.FORWARD:
-                self.backward()
+                return self.backward()
+
+    @staticmethod
+    def _get_future(request: Optional[Request]) -> Optional["asyncio.Future[bool]"]:
+        # There cannot be a running loop unless asyncio was imported, and
+        # programs that never use it should not pay for importing it.
+        asyncio_module = sys.modules.get("asyncio")
+        if asyncio_module is None:
+            return None
+        try:
+            loop = asyncio_module.get_running_loop()
+        except RuntimeError:
+            return None
+        if request is None:
+            future = loop.create_future()
+            future.set_result(False)
+            return future
+        if request.future is None:
+            request.future = loop.create_future()
+            if request.terminated is True:
+                request.future.set_result(request.interrupt is False)
+        return request.future
 
     @abstractmethod
-    def _do_animation(self, request: Request) -> None:
-        """ """
+    def _jump(self, request: Request) -> None:
+        """ Show the end of `request` at once, without animating. """
+
+    @abstractmethod
+    def _compile_plan(self, direction: Direction) -> Any:
+        """ Resolve fixed-offset stepping towards `direction` from the current options. """
+
+    @abstractmethod
+    def _prepare_steps(self, request: Request) -> None:
+        """ Set up fixed-offset stepping for `request`, including `request.interval`. """
+
+    @abstractmethod
+    def _prepare_timed(self, request: Request, previous: Optional[Request]) -> None:
+        """ Set up time-based interpolation for `request`. """
+
+    @abstractmethod
+    def _prepare_spring(self, request: Request, previous: Optional[Request]) -> None:
+        """ Release the springs of `request` (see `_start_springs`). """
+
+    @abstractmethod
+    def _spring_animation(self, request: Request) -> bool:
+        """ Move to where the springs are now; False once they settled. """
+
+    @abstractmethod
+    def _animation(self, request: Request) -> bool:
+        """ Advance one fixed-offset step; False once `request` is over. """
+
+    @abstractmethod
+    def _timed_animation(self, request: Request) -> bool:
+        """ Advance to the current time; False once `request` is over. """
+
+
+class UniformStepping:
+    """
+    The fixed-offset options of frames that move everything they animate by
+    the same `forward_offset` (`backward_offset`) every `forward_speed`
+    (`backward_speed`) ms. To be mixed in before BaseFrame.
+    """
+
+    @property
+    def forward_offset(self) -> float:
+        return self._forward_offset
+
+    @forward_offset.setter
+    def forward_offset(self, offset: float) -> None:
+        self._forward_offset = self._get_offset(offset, "forward_offset")
+        self._invalidate_plans()
+
+    @property
+    def backward_offset(self) -> float:
+        return self._backward_offset
+
+    @backward_offset.setter
+    def backward_offset(self, offset: float) -> None:
+        self._backward_offset = self._get_offset(offset, "backward_offset")
+        self._invalidate_plans()
+
+    @property
+    def forward_speed(self) -> int:
+        return self._forward_speed
+
+    @forward_speed.setter
+    def forward_speed(self, speed: int) -> None:
+        self._forward_speed = speed
+        self._invalidate_plans()
+
+    @property
+    def backward_speed(self) -> int:
+        return self._backward_speed
+
+    @backward_speed.setter
+    def backward_speed(self, speed: int) -> None:
+        self._backward_speed = speed
+        self._invalidate_plans()
+
+    @staticmethod
+    def _get_offset(offset: float, attr_name: str) -> float:
+        offset = float(offset)
+        if offset <= 0:
+            raise ValueError(f"'{attr_name}' must be a positive number.")
+        return offset
@@ -0,0 +1,210 @@
+import logging
+import tkinter
+from typing import Any, Dict, NamedTuple, Optional, Sequence
+from anitk.base import BaseFrame, Direction, Request, UniformStepping
+from anitk.easing import compile_frames
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class CanvasPlan(NamedTuple):
+    interval: int
+    offset: float
+
+
+class CanvasSlideFrame(UniformStepping, BaseFrame):
+    """
+    Moves many items of one Canvas at once, each between its own start and
+    end position, with the request model of the other frames: `forward`
+    sends every item to its end, `backward` to its start.
+
+    Positions live in NumPy arrays and a tick computes all of them in one
+    vectorized step; the items that moved to another pixel are then moved
+    by a single Tcl script, so a tick costs one round-trip to Tk however
+    many items there are. Create the items on `canvas`, then `add` them.
+
+    Positions are the top-left corner of each item in canvas pixels. In
+    fixed-offset mode every item moves `forward_offset` (`backward_offset`)
+    pixels along its path per tick; with a `duration` all items share the
+    eased progress, and with a `spring` each one follows the spring.
+    """
+
+    _geometry_methods = ("_draw",)
+
+    def __init__(
+        self,
+        forward_offset: float = 10.0,
+        backward_offset: float = 10.0,
+
+        forward_speed: int = 10,
+        backward_speed: int = 10,
+
+        canvas_options: Optional[Dict[str, Any]] = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        if numpy is None:
+            raise ImportError("CanvasSlideFrame requires NumPy: install anitk[canvas].")
+        super().__init__(*args, **kwargs)
+        self.forward_offset = forward_offset
+        self.backward_offset = backward_offset
+        self.forward_speed = forward_speed
+        self.backward_speed = backward_speed
+
+        self.canvas = tkinter.Canvas(self, **{"highlightthickness": 0, "borderwidth": 0, **(canvas_options or {})})
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+
+        self._ids = numpy.empty(0, dtype=numpy.int64)
+        self._starts = numpy.empty((0, 2))
+        self._ends = numpy.empty((0, 2))
+        self._positions = numpy.empty((0, 2))
+        self._drawn = numpy.empty((0, 2), dtype=numpy.int64)
+        # Where the running request started from and heads to.
+        self._origins = self._positions
+        self._targets = self._positions
+        self._velocities = self._positions
+        self._progress_frames = (0.0, 1.0)
+
+    @property
+    def count(self) -> int:
+        return len(self._ids)
+
+    def add(self, items: Sequence[int], starts, ends) -> None:
+        """
+        Animate the Canvas `items` from now on, item `i` between `starts[i]`
+        and `ends[i]` (`(x, y)` pairs). They are moved to where the frame
+        currently is: at their ends if it is opened, at their starts otherwise.
+        """
+        if self.animating is True:
+            raise RuntimeError("Items cannot be added while an animation is running.")
+        ids = numpy.asarray(items, dtype=numpy.int64).reshape(-1)
+        starts = numpy.asarray(starts, dtype=float).reshape(-1, 2)
+        ends = numpy.asarray(ends, dtype=float).reshape(-1, 2)
+        if not len(ids) == len(starts) == len(ends):
+            raise ValueError("'items', 'starts' and 'ends' must have the same length.")
+        positions = ends if self._get_pending_request().direction is Direction.FORWARD else starts
+        self._ids = numpy.concatenate((self._ids, ids))
+        self._starts = numpy.concatenate((self._starts, starts))
+        self._ends = numpy.concatenate((self._ends, ends))
+        self._positions = numpy.concatenate((self._positions, positions))
+        # Never drawn: every new item is moved by the next `_draw`.
+        self._drawn = numpy.concatenate((self._drawn, numpy.full((len(ids), 2), numpy.iinfo(numpy.int64).min)))
+        self._draw()
+
+    def _draw(self) -> None:
+        """ Move the items whose pixel changed, in one Tcl script. """
+        rounded = numpy.floor(self._positions + 0.5).astype(numpy.int64)
+        changed = numpy.flatnonzero((rounded != self._drawn).any(axis=1))
+        if changed.size == 0:
+            return
+        self._drawn[changed] = rounded[changed]
+        path = self.canvas._w
+        self.canvas.tk.eval("\n".join(
+            f"{path} moveto {item} {x} {y}"
+            for item, (x, y) in zip(self._ids[changed].tolist(), rounded[changed].tolist())
+        ))
+
+    def _get_targets(self, direction: Direction):
+        return self._ends if direction is Direction.FORWARD else self._starts
+
+    def _jump(self, request: Request) -> None:
+        self._positions = self._get_targets(request.direction).copy()
+        self._draw()
+
+    def _compile_plan(self, direction: Direction) -> CanvasPlan:
+        if direction is Direction.FORWARD:
+            return CanvasPlan(self.forward_speed, self.forward_offset)
+        return CanvasPlan(self.backward_speed, self.backward_offset)
+
+    def _prepare_steps(self, request: Request) -> None:
+        plan = self._get_plan(request.direction)
+        request.interval, self._step_offset = plan.interval, plan.offset
+        self._targets = self._get_targets(request.direction)
+
+    def _animation(self, request: Request) -> bool:
+        step = self._step_offset * self._get_owed_steps(request)
+        delta = self._targets - self._positions
+        distance = numpy.hypot(delta[:, 0], delta[:, 1])
+        # Items closer than a step land on their target.
+        share = numpy.divide(step, distance, out=numpy.ones_like(distance), where=distance > step)
+        self._positions = self._positions + delta * share[:, None]
+        self._draw()
+        if numpy.all(distance <= step):
+            self._positions = self._targets.copy()
+            return self._finish(request)
+        return True
+
+    def _prepare_timed(self, request: Request, previous: Optional[Request]) -> None:
+        self._targets = self._get_targets(request.direction)
+        self._origins = self._positions.copy()
+        # The item that has the most of its path left sets the duration.
+        span = numpy.abs(self._ends - self._starts)
+        remaining = numpy.abs(self._targets - self._positions)
+        shares = numpy.divide(remaining, span, out=numpy.zeros_like(span), where=span > 0)
+        self._start_timed_request(request, float(shares.max()) if shares.size else 0.0)
+        # All items share the eased progress, so a tick is one table lookup
+        # and one multiply-add over the arrays.
+        self._progress_frames = compile_frames(
+            0.0, 1.0, self.fps, request.duration, self.easing, self.offset_precision
+        )
+
+    def _timed_animation(self, request: Request) -> bool:
+        index = self._get_frame_index(request)
+        progress = self._progress_frames[index]
+        self._positions = self._origins + (self._targets - self._origins) * progress
+        self._draw()
+        if index >= request.last_frame:
+            return self._finish(request)
+        return True
+
+    def _prepare_spring(self, request: Request, previous: Optional[Request]) -> None:
+        """
+        The spring equation is linear: every item moves like the unit
+        displacement response scaled by its own displacement, plus the unit
+        velocity response scaled by its own velocity. Two scalar motions
+        therefore serve all the items.
+        """
+        if previous is not None and len(self._springs) == 2:
+            displacement, velocity = self._springs
+            elapsed = self._spring_elapsed
+            velocities = (
+                (self._origins - self._targets) * displacement.velocity(elapsed)
+                + self._velocities * velocity.velocity(elapsed)
+            )
+        else:
+            velocities = numpy.zeros_like(self._positions)
+        self._targets = self._get_targets(request.direction)
+        self._origins = self._positions.copy()
+        self._velocities = velocities
+        self._springs = (self.spring.motion(1.0, 0.0), self.spring.motion(0.0, 0.0, 1.0))
+        self._spring_elapsed = 0.0
+        # Both terms get a quarter pixel, so together they stay within half.
+        displacement = numpy.abs(self._origins - self._targets).max(initial=0.0)
+        velocity = numpy.abs(velocities).max(initial=0.0)
+        request.duration = max(
+            self._springs[0].settle_time(0.25 / displacement) if displacement > 0 else 0.0,
+            self._springs[1].settle_time(0.25 / velocity) if velocity > 0 else 0.0,
+        )
+
+    def _spring_animation(self, request: Request) -> bool:
+        elapsed = self._get_spring_elapsed(request)
+        if elapsed >= request.duration:
+            self._positions = self._targets.copy()
+            self._draw()
+            return self._finish(request)
+        displacement, velocity = self._springs
+        self._positions = (
+            self._targets
+            + (self._origins - self._targets) * displacement.position(elapsed)
+            + self._velocities * velocity.position(elapsed)
+        )
+        self._draw()
+        return True
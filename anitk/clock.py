@@ -0,0 +1,402 @@
+import collections
+import logging
+import operator
+import time
+import weakref
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple
+from anitk.enums import Priority
+
+
+logger = logging.getLogger(__name__)
+
+
+Step = Callable[[], bool]
+
+# Steps run in rank order, so the budget of a pass goes to the most important ones first.
+_RANKS = {Priority.FOREGROUND: 0, Priority.BACKGROUND: 1, Priority.IDLE: 2}
+_IDLE_RANK = _RANKS[Priority.IDLE]
+_get_rank = operator.attrgetter("rank")
+
+
+class _Entry:
+    """ A registered step, holding its frame weakly so a scheduler never keeps it alive. """
+
+    __slots__ = ("handle", "due", "interval", "owner", "function", "adaptive", "active", "rank", "complete")
+
+    def __init__(
+        self,
+        handle: int,
+        due: float,
+        interval: int,
+        step: Step,
+        adaptive: bool,
+        rank: int,
+        complete: Optional[Callable[[], None]],
+    ) -> None:
+        self.handle = handle
+        self.due = due
+        self.interval = interval
+        owner = getattr(step, "__self__", None)
+        self.owner = None if owner is None else weakref.ref(owner)
+        self.function = step if owner is None else step.__func__
+        self.adaptive = adaptive
+        self.active = True
+        self.rank = rank
+        self.complete = None if complete is None else weakref.WeakMethod(complete)
+
+    def run(self) -> bool:
+        """ Run the step; one whose object was collected is over. """
+        if self.owner is None:
+            return self.function()
+        owner = self.owner()
+        return False if owner is None else self.function(owner)
+
+
+class Scheduler(ABC):
+    """
+    Runs registered steps, each at its own interval, until they return False.
+    Subclasses decide when `_advance` is called.
+
+    With a `budget`, a pass stops spending time on steps below
+    `Priority.FOREGROUND` once it has run for `budget` ms: due background
+    steps skip this pass (they drop a frame) and due idle steps are
+    completed at once through their `complete` callable.
+    """
+
+    def __init__(self) -> None:
+        self._animations: Dict[int, _Entry] = {}
+        # In rank order, walked by `_advance` without copying.
+        self._entries: List[_Entry] = []
+        self._next_handle = 0
+        self._advancing = False
+        self._dropped = False
+        self.scale = 1.0
+        self.budget: Optional[float] = None
+        self.dropped_frames = 0
+
+    @property
+    def idle(self) -> bool:
+        return not self._animations
+
+    @abstractmethod
+    def now(self) -> float:
+        """ Current time in milliseconds. """
+
+    @abstractmethod
+    def _schedule(self) -> None:
+        """ Called whenever the set of registered steps or their intervals change. """
+
+    def register(
+        self,
+        step: Step,
+        ms: int,
+        adaptive: bool = False,
+        priority: Priority = Priority.FOREGROUND,
+        complete: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """ `complete` ends the step's work at once, for idle steps over budget. """
+        handle = self._next_handle
+        self._next_handle += 1
+        entry = _Entry(handle, self.now(), ms, step, adaptive, _RANKS[priority], complete)
+        self._animations[handle] = entry
+        self._insert(entry)
+        self._schedule()
+        return handle
+
+    def _insert(self, entry: _Entry) -> None:
+        entries = self._entries
+        entries.append(entry)
+        if len(entries) > 1 and entries[-2].rank > entry.rank:
+            if self._advancing is True:
+                # Runs in this pass anyway; put in its place when the pass ends.
+                self._dropped = True
+            else:
+                entries.sort(key=_get_rank)
+
+    def set_priority(self, handle: int, priority: Priority) -> None:
+        entry = self._animations.get(handle)
+        if entry is not None and entry.rank != _RANKS[priority]:
+            entry.rank = _RANKS[priority]
+            if self._advancing is True:
+                self._dropped = True
+            else:
+                self._entries.sort(key=_get_rank)
+
+    def unregister(self, handle: int) -> None:
+        entry = self._animations.pop(handle, None)
+        if entry is not None:
+            entry.active = False
+            if self._advancing is True:
+                self._dropped = True
+            else:
+                self._entries.remove(entry)
+            self._schedule()
+
+    def set_interval(self, handle: int, ms: int) -> None:
+        entry = self._animations.get(handle)
+        if entry is not None and entry.interval != ms:
+            entry.due = min(entry.due, self.now() + ms)
+            entry.interval = ms
+            self._schedule()
+
+    def get_schedule(self, handle: int) -> Tuple[float, float]:
+        """ When the step of `handle` is due, and how far apart its passes currently are. """
+        entry = self._animations[handle]
+        return entry.due, entry.interval * self.scale if entry.adaptive is True else entry.interval
+
+    # Run on every tick: walked by index, as `min` or a `for` loop would allocate.
+    def _get_interval(self) -> Optional[int]:
+        entries = self._entries
+        interval = None
+        index = 0
+        while index < len(entries):
+            entry = entries[index]
+            if entry.active is True and (interval is None or entry.interval < interval):
+                interval = entry.interval
+            index += 1
+        return interval
+
+    def _get_next_due(self) -> Optional[float]:
+        entries = self._entries
+        due = None
+        index = 0
+        while index < len(entries):
+            entry = entries[index]
+            if entry.active is True and (due is None or entry.due < due):
+                due = entry.due
+            index += 1
+        return due
+
+    def _advance(self, now: float) -> None:
+        # Steps registered while advancing run in this same pass.
+        animations = self._animations
+        entries = self._entries
+        deadline = None if self.budget is None else time.perf_counter() * 1000 + self.budget
+        self._advancing = True
+        index = -1
+        try:
+            while index + 1 < len(entries):
+                index += 1
+                entry = entries[index]
+                if entry.active is False or entry.due > now + 1:
+                    continue
+                if entry.rank > 0 and deadline is not None and time.perf_counter() * 1000 > deadline:
+                    self._degrade(entry, now)
+                    continue
+                if entry.run() is False:
+                    if entry.active is True:
+                        entry.active = False
+                        del animations[entry.handle]
+                        self._finished(entry)
+                    self._dropped = True
+                elif entry.adaptive is True:
+                    entry.due = now + entry.interval * self.scale
+                else:
+                    entry.due = now + entry.interval
+        finally:
+            self._advancing = False
+            if self._dropped is True:
+                self._dropped = False
+                self._entries[:] = sorted((entry for entry in self._entries if entry.active is True), key=_get_rank)
+
+    def _degrade(self, entry: _Entry, now: float) -> None:
+        """ Over budget: an idle step is completed if it can be, any other skips this pass. """
+        if entry.rank == _IDLE_RANK and entry.complete is not None:
+            complete = entry.complete()
+            if complete is not None:
+                # Completing unregisters the step.
+                complete()
+                return
+        self.dropped_frames += 1
+        entry.due = now + entry.interval
+
+    def _finished(self, entry: _Entry) -> None:
+        """ Called when a step has returned False and was dropped. """
+
+
+class FrameClock(Scheduler):
+    """
+    Drives every animation that shares a Tk interpreter from a single `after` loop.
+
+    Animations register a step callable together with their own interval; on each
+    wakeup the clock runs every step that is due and schedules a single `after`
+    for the earliest pending one. When no animation is left the clock goes idle.
+
+    Setting `budget` (say 8 ms) bounds the time a wakeup gives to background
+    and idle animations, so that input handling is not starved however many
+    of them run; foreground animations are never degraded.
+    """
+
+    _clocks: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    MAX_SCALE = 4.0
+    SCALE_STEP = 1.25
+    LOAD_SMOOTHING = 0.2
+    MAILBOX_INTERVAL = 16
+    MAILBOX_IDLE_INTERVAL = 50
+
+    def __init__(self, root, timer: Callable[[], float] = time.perf_counter) -> None:
+        super().__init__()
+        # Weak: `_clocks` would otherwise keep every root alive.
+        self._root = weakref.ref(root)
+        self.timer = timer
+        self.frame_budget: Optional[float] = None
+        self.load = 0.0
+        self._after_id: Optional[str] = None
+        self._after_due: Optional[float] = None
+        self._tick_command: Optional[str] = None
+        self._adaptive_interval: Optional[int] = None
+        self._ticking = False
+        # Posted from other threads: `append` and `popleft` are atomic.
+        self._posts: "collections.deque" = collections.deque()
+        self._mailbox_users = 0
+        self._mailbox_handle: Optional[int] = None
+        self._watch_id: Optional[str] = None
+        self._watch_command: Optional[str] = None
+
+    @property
+    def root(self):
+        return self._root()
+
+    @classmethod
+    def of(cls, widget) -> "FrameClock":
+        root = widget._root()
+        clock = cls._clocks.get(root)
+        if clock is None:
+            clock = cls._clocks[root] = cls(root)
+        return clock
+
+    def now(self) -> float:
+        return self.timer() * 1000
+
+    def _schedule(self) -> None:
+        if self._ticking is True:
+            return
+        due = self._get_next_due()
+        if due is None:
+            self._cancel()
+            return
+        if self._after_id is not None:
+            if self._after_due <= due:
+                return
+            self._cancel()
+        self._after(due)
+
+    def _after(self, due: float) -> None:
+        # Registered once: `root.after` would create a Tcl command per call.
+        if self._tick_command is None:
+            self._tick_command = self.root.register(self._tick)
+        self._after_due = due
+        # Not `max(0, round(...))`, which allocate.
+        ms = int(due - self.now() + 0.5)
+        self._after_id = self.root.tk.call("after", ms if ms > 0 else 0, self._tick_command)
+
+    def _cancel(self) -> None:
+        if self._after_id is not None:
+            self.root.tk.call("after", "cancel", self._after_id)
+            self._after_id = None
+            self._after_due = None
+
+    def _tick(self) -> None:
+        now = self.now()
+        latency = now - self._after_due if self._after_due is not None and now > self._after_due else 0.0
+        self._after_id = None
+        self._after_due = None
+        self._ticking = True
+        start = time.perf_counter()
+        try:
+            self._advance(now)
+        finally:
+            self._ticking = False
+        if self._adaptive_interval is not None or self.frame_budget is not None:
+            self._adapt((time.perf_counter() - start) * 1000 + latency)
+        else:
+            self.scale = 1.0
+        self._schedule()
+
+    def post(self, frame, direction) -> None:
+        """ Thread-safe: have `frame` take `direction` on the next drain of the mailbox. """
+        self._posts.append((frame, direction))
+
+    def open_mailbox(self) -> None:
+        """ Start watching for posted requests. Tk thread only. """
+        self._mailbox_users += 1
+        if self._mailbox_users == 1:
+            self._watch_posts()
+
+    def close_mailbox(self) -> None:
+        self._mailbox_users -= 1
+        if self._mailbox_users == 0:
+            if self._mailbox_handle is not None:
+                self.unregister(self._mailbox_handle)
+                self._mailbox_handle = None
+            if self._watch_id is not None:
+                self.root.tk.call("after", "cancel", self._watch_id)
+                self._watch_id = None
+            # Only destroyed frames can be left in it: do not keep them alive.
+            self._posts.clear()
+
+    def _watch_posts(self) -> None:
+        """ Poll for posts with a plain Tk timer, so the clock stays idle until one arrives. """
+        self._watch_id = None
+        if self._posts:
+            self._mailbox_handle = self.register(self._drain_posts, self.MAILBOX_INTERVAL)
+            return
+        if self._watch_command is None:
+            self._watch_command = self.root.register(self._watch_posts)
+        self._watch_id = self.root.tk.call("after", self.MAILBOX_IDLE_INTERVAL, self._watch_command)
+
+    def _drain_posts(self) -> bool:
+        """ Hand the posted requests to their frames, only the latest one per frame. """
+        posts = self._posts
+        if not posts:
+            # A whole interval without posts: back to watching.
+            self._mailbox_handle = None
+            self._watch_posts()
+            return False
+        latest = {}
+        while posts:
+            frame, direction = posts.popleft()
+            latest[frame] = direction
+        for frame, direction in latest.items():
+            # Posted before the frame was destroyed.
+            if frame.destroyed is False:
+                frame._put_request(direction)
+        return True
+
+    def register(
+        self,
+        step: Step,
+        ms: int,
+        adaptive: bool = False,
+        priority: Priority = Priority.FOREGROUND,
+        complete: Optional[Callable[[], None]] = None,
+    ) -> int:
+        handle = super().register(step, ms, adaptive, priority, complete)
+        if adaptive is True:
+            self._update_adaptive_interval()
+        return handle
+
+    def unregister(self, handle: int) -> None:
+        super().unregister(handle)
+        self._update_adaptive_interval()
+
+    def _finished(self, entry: _Entry) -> None:
+        if entry.adaptive is True:
+            self._update_adaptive_interval()
+
+    def _update_adaptive_interval(self) -> None:
+        self._adaptive_interval = min(
+            (entry.interval for entry in self._animations.values() if entry.adaptive is True),
+            default=None,
+        )
+
+    def _adapt(self, cost: float) -> None:
+        """ Stretch adaptive steps apart while the smoothed cost of a wakeup exceeds the frame budget. """
+        budget = self.frame_budget if self.frame_budget is not None else self._adaptive_interval
+        self.load += (cost - self.load) * self.LOAD_SMOOTHING
+        if self.load > budget:
+            self.scale = min(self.MAX_SCALE, self.scale * self.SCALE_STEP)
+        elif self.load < budget / 2:
+            self.scale = max(1.0, self.scale / self.SCALE_STEP)
@@ -0,0 +1,39 @@
+import re
+from functools import lru_cache
+from typing import Tuple
+
+
+RGB = Tuple[int, int, int]
+
+_HEX_COLOR = re.compile(r"#(?:[0-9a-fA-F]{3}){1,4}")
+
+
+def parse_color(color: str) -> RGB:
+    """ A `#rgb`, `#rrggbb`, `#rrrgggbbb` or `#rrrrggggbbbb` color as 8-bit channels. """
+    if _HEX_COLOR.fullmatch(color) is None:
+        raise ValueError(f"Invalid color: {color!r}. Expected a '#' followed by 3, 6, 9 or 12 hex digits.")
+    size = (len(color) - 1) // 3
+    channels = (int(color[1 + i * size:1 + (i + 1) * size], 16) for i in range(3))
+    if size == 1:
+        return tuple(channel * 17 for channel in channels)
+    return tuple(channel >> (size - 2) * 4 for channel in channels)
+
+
+def format_color(rgb: RGB) -> str:
+    return "#%02x%02x%02x" % rgb
+
+
+def get_ramp_steps(start: str, end: str) -> int:
+    """ The fewest steps for a ramp from `start` to `end` that changes a channel by at most one per step. """
+    steps = max(abs(a - b) for a, b in zip(parse_color(start), parse_color(end)))
+    return steps if steps > 0 else 1
+
+
+@lru_cache(maxsize=512)
+def color_ramp(start: str, end: str, steps: int) -> Tuple[str, ...]:
+    """ `steps + 1` colors evenly spaced from `start` to `end`, already formatted for Tk. """
+    first, last = parse_color(start), parse_color(end)
+    return tuple(
+        format_color(tuple(int(a + (b - a) * i / steps + 0.5) for a, b in zip(first, last)))
+        for i in range(steps + 1)
+    )
@@ -0,0 +1,100 @@
+import math
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+from anitk.enums import Easing
+
+
+_BACK = 1.70158
+_BACK_IN_OUT = _BACK * 1.525
+_SLOPE_STEP = 1e-6
+
+
+def _linear(t: float) -> float:
+    return t
+
+
+def _ease_in(t: float) -> float:
+    return t * t
+
+
+def _ease_out(t: float) -> float:
+    return t * (2 - t)
+
+
+def _ease_in_out(t: float) -> float:
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+
+def _cubic_in(t: float) -> float:
+    return t ** 3
+
+
+def _cubic_out(t: float) -> float:
+    return 1 - (1 - t) ** 3
+
+
+def _cubic_in_out(t: float) -> float:
+    return 4 * t ** 3 if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+
+
+def _back_in(t: float) -> float:
+    return (_BACK + 1) * t ** 3 - _BACK * t * t
+
+
+def _back_out(t: float) -> float:
+    return 1 + (_BACK + 1) * (t - 1) ** 3 + _BACK * (t - 1) ** 2
+
+
+def _back_in_out(t: float) -> float:
+    if t < 0.5:
+        return (2 * t) ** 2 * ((_BACK_IN_OUT + 1) * 2 * t - _BACK_IN_OUT) / 2
+    return ((2 * t - 2) ** 2 * ((_BACK_IN_OUT + 1) * (t * 2 - 2) + _BACK_IN_OUT) + 2) / 2
+
+
+EASINGS: Dict[Easing, Callable[[float], float]] = {
+    Easing.LINEAR: _linear,
+    Easing.EASE_IN: _ease_in,
+    Easing.EASE_OUT: _ease_out,
+    Easing.EASE_IN_OUT: _ease_in_out,
+    Easing.CUBIC_IN: _cubic_in,
+    Easing.CUBIC_OUT: _cubic_out,
+    Easing.CUBIC_IN_OUT: _cubic_in_out,
+    Easing.BACK_IN: _back_in,
+    Easing.BACK_OUT: _back_out,
+    Easing.BACK_IN_OUT: _back_in_out,
+}
+
+
+def get_frame_count(fps: int, duration: float) -> int:
+    return max(1, math.ceil(duration * fps / 1000))
+
+
+@lru_cache(maxsize=512)
+def compile_frames(
+    start: float,
+    end: float,
+    fps: int,
+    duration: float,
+    easing: Easing,
+    precision: int,
+    velocity: Optional[float] = None,
+) -> Tuple[float, ...]:
+    """
+    Every position of a `duration` ms animation from `start` to `end` sampled
+    at `fps`, already eased and rounded. The table is shared by all the frames
+    animating the same path, so a tick only has to index into it.
+
+    `velocity` is the initial slope (distance per whole animation) to match
+    when retargeting a running animation; a t(1 - t)^2 term bends the eased
+    curve so it leaves `start` at that slope and still lands on `end`.
+    """
+    function = EASINGS[easing]
+    count = get_frame_count(fps, duration)
+    distance = end - start
+    correction = 0.0
+    if velocity is not None:
+        correction = velocity - distance * function(_SLOPE_STEP) / _SLOPE_STEP
+    return tuple(
+        round(start + distance * function(t) + correction * t * (1 - t) ** 2, precision)
+        for t in (i / count for i in range(count + 1))
+    )
@@ -32,3 +32,22 @@ class Orientation(_StrEnum):
     NORTH_WEST = "nw"
     SOUTH_EAST = "se"
     SOUTH_WEST = "sw"
+
+
+class Priority(_StrEnum):
+    FOREGROUND = "foreground"
+    BACKGROUND = "background"
+    IDLE = "idle"
+
+
+class Easing(_StrEnum):
+    LINEAR = "linear"
+    EASE_IN = "ease_in"
+    EASE_OUT = "ease_out"
+    EASE_IN_OUT = "ease_in_out"
+    CUBIC_IN = "cubic_in"
+    CUBIC_OUT = "cubic_out"
+    CUBIC_IN_OUT = "cubic_in_out"
+    BACK_IN = "back_in"
+    BACK_OUT = "back_out"
+    BACK_IN_OUT = "back_in_out"
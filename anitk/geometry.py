@@ -0,0 +1,138 @@
+import logging
+import tkinter
+import weakref
+from typing import Callable, List, Set
+
+
+logger = logging.getLogger(__name__)
+
+
+Listener = Callable[..., None]
+
+
+class _Observed:
+    """ Widget state kept from Tk events, with weakly held listeners. """
+
+    def __init__(self) -> None:
+        self._listeners: List[weakref.WeakMethod] = []
+
+    def subscribe(self, listener: Listener) -> None:
+        """ `listener` must be a bound method. """
+        if all(reference() != listener for reference in self._listeners):
+            self._listeners.append(weakref.WeakMethod(listener))
+
+    def unsubscribe(self, listener: Listener) -> None:
+        self._listeners = [reference for reference in self._listeners if reference() not in (None, listener)]
+
+    def _notify(self, *args) -> None:
+        for reference in list(self._listeners):
+            listener = reference()
+            if listener is None:
+                self._listeners.remove(reference)
+            else:
+                listener(*args)
+
+
+class Geometry(_Observed):
+    """
+    Size of a widget in pixels, kept up to date by its `<Configure>` events so
+    that animations can read it without a `winfo` round-trip to Tk.
+
+    There is one instance per widget, shared by every frame interested in it.
+    Listeners are called with the new width and height whenever the size
+    changes; they are held weakly, so subscribing does not keep a frame alive.
+    """
+
+    _geometries: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def __init__(self, widget) -> None:
+        super().__init__()
+        self._widget = weakref.ref(widget)
+        self.width = widget.winfo_width()
+        self.height = widget.winfo_height()
+        # CTk widgets redirect `bind` to an inner canvas: bind the widget itself,
+        # adding to its bindings rather than replacing them.
+        tkinter.Misc.bind(widget, "<Configure>", self._on_configure, "+")
+
+    @classmethod
+    def of(cls, widget) -> "Geometry":
+        geometry = cls._geometries.get(widget)
+        if geometry is None:
+            geometry = cls._geometries[widget] = cls(widget)
+        return geometry
+
+    def _on_configure(self, event) -> None:
+        # A toplevel also receives the `<Configure>` events of its descendants.
+        if event.widget is not self._widget():
+            return
+        if event.width == self.width and event.height == self.height:
+            return
+        self.width, self.height = event.width, event.height
+        logger.debug("resized to %sx%s", event.width, event.height)
+        self._notify(event.width, event.height)
+
+
+class Visibility(_Observed):
+    """
+    Which widgets of a toplevel are hidden, kept from `<Map>`/`<Unmap>` events.
+
+    A toplevel receives the events of all its descendants, so one instance per
+    toplevel tells for any widget in it whether the widget, one of its
+    ancestors or the toplevel itself (iconified, withdrawn) was unmapped,
+    without asking Tk. Widgets count as visible until an `<Unmap>` says
+    otherwise, so frames animated before the first map still animate.
+    Listeners are called without arguments whenever that changes.
+    """
+
+    _visibilities: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def __init__(self, toplevel) -> None:
+        super().__init__()
+        self._path = toplevel._w
+        self._hidden: Set[str] = set()
+        self._ignored: Set[str] = set()
+        tkinter.Misc.bind(toplevel, "<Map>", self._on_map, "+")
+        tkinter.Misc.bind(toplevel, "<Unmap>", self._on_unmap, "+")
+
+    @classmethod
+    def of(cls, widget) -> "Visibility":
+        toplevel = widget
+        while isinstance(toplevel, tkinter.Wm) is False and getattr(toplevel, "master", None) is not None:
+            toplevel = toplevel.master
+        visibility = cls._visibilities.get(toplevel)
+        if visibility is None:
+            visibility = cls._visibilities[toplevel] = cls(toplevel)
+        return visibility
+
+    def hides(self, widget) -> bool:
+        if not self._hidden:
+            return False
+        if self._path in self._hidden:
+            return True
+        path = widget._w
+        return any(path == hidden or path.startswith(hidden + ".") for hidden in self._hidden)
+
+    def ignore_unmaps(self, widget, ignored: bool) -> None:
+        """
+        While `ignored`, `<Unmap>` events of `widget` itself are not recorded:
+        it unmaps itself on purpose (a slide shown on a snapshot) and does
+        not count as hidden.
+        """
+        if ignored is True:
+            self._ignored.add(widget._w)
+        else:
+            self._ignored.discard(widget._w)
+
+    def _on_map(self, event) -> None:
+        path = str(event.widget)
+        if path in self._hidden:
+            self._hidden.discard(path)
+            logger.debug("%s mapped", path)
+            self._notify()
+
+    def _on_unmap(self, event) -> None:
+        path = str(event.widget)
+        if path not in self._hidden and path not in self._ignored:
+            self._hidden.add(path)
+            logger.debug("%s unmapped", path)
+            self._notify()
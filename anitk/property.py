@@ -0,0 +1,243 @@
+import logging
+import math
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+from anitk.base import BaseFrame, Direction, Request, UniformStepping
+from anitk.color import color_ramp, format_color, get_ramp_steps
+
+
+logger = logging.getLogger(__name__)
+
+
+Value = Union[int, float, str, Tuple[str, str]]
+
+
+class PropertyPlan(NamedTuple):
+    interval: int
+    offset: float
+    sign: int
+    bound: float
+
+
+class NumberTrack(NamedTuple):
+    name: str
+    start: float
+    span: float
+    integral: bool
+    # Options like widths and radii reject negative values: a track whose
+    # ends are both non-negative never goes below 0, even when overshooting.
+    floor: Optional[float]
+
+
+class ColorTrack(NamedTuple):
+    name: str
+    ramp: Tuple[str, ...]
+    steps: int
+
+
+class PropertyFrame(UniformStepping, BaseFrame):
+    """
+    Tweens options of `widget` (the frame itself by default): `forward`
+    sends every option in `properties` to its second value, `backward` to
+    its first.
+
+    Values are numbers (`corner_radius`, `border_width`, ...) or colors
+    (`fg_color`, `border_color`, ...): Tk color names, `#rrggbb` strings or
+    CustomTkinter (light, dark) pairs. All options share one progress from 0
+    (backward) to 1 (forward); a color is looked up in a cached ramp of
+    preformatted colors, so a tick never parses nor formats one. The options
+    that changed are set with a single `configure` per tick.
+
+    In fixed-offset mode the progress moves `forward_offset`
+    (`backward_offset`) per tick, a share of the whole path.
+    """
+
+    _geometry_methods = ("_apply",)
+
+    def __init__(
+        self,
+        properties: Dict[str, Tuple[Value, Value]],
+        widget: Optional[Any] = None,
+
+        forward_speed: int = 10,
+        backward_speed: int = 10,
+
+        forward_offset: float = 0.05,
+        backward_offset: float = 0.05,
+
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.forward_speed = forward_speed
+        self.backward_speed = backward_speed
+        self.forward_offset = forward_offset
+        self.backward_offset = backward_offset
+
+        self._widget = widget
+        self._progress = 1.0 if self._opened else 0.0
+        self._frames: Tuple[float, ...] = ()
+        self._number_tracks: Tuple[NumberTrack, ...] = ()
+        self._color_tracks: Tuple[ColorTrack, ...] = ()
+        self._resolution = 1
+        self._applied: Dict[str, Any] = {}
+        # Filled again on every tick instead of building a dict per tick.
+        self._options: Dict[str, Any] = {}
+        self.properties = properties
+
+    @property
+    def widget(self) -> Any:
+        return self if self._widget is None else self._widget
+
+    @property
+    def properties(self) -> Dict[str, Tuple[Value, Value]]:
+        return self._properties
+
+    @properties.setter
+    def properties(self, value: Dict[str, Tuple[Value, Value]]) -> None:
+        if self.animating is True:
+            raise RuntimeError("Properties cannot be changed while an animation is running.")
+        properties = {}
+        for name, ends in value.items():
+            if len(ends) != 2:
+                raise ValueError(f"'{name}' needs a (backward, forward) pair of values.")
+            kinds = {self._get_kind(end, name) for end in ends}
+            if len(kinds) != 1:
+                raise TypeError(f"'{name}' mixes a number and a color.")
+            properties[name] = tuple(ends)
+        self._properties = properties
+        self._compile_tracks()
+        self._applied.clear()
+        self._apply(self._progress)
+
+    @staticmethod
+    def _get_kind(value: Value, name: str) -> str:
+        if isinstance(value, (int, float)) and isinstance(value, bool) is False:
+            return "number"
+        if isinstance(value, str) or (
+            isinstance(value, (tuple, list)) and len(value) == 2 and all(isinstance(v, str) for v in value)
+        ):
+            return "color"
+        raise TypeError(f"Invalid value for '{name}': {value!r}. Expected a number or a color.")
+
+    @staticmethod
+    def _get_offset(offset: float, attr_name: str) -> float:
+        offset = float(offset)
+        if not 0 < offset <= 1:
+            raise ValueError(f"'{attr_name}' must be a share of the path, in (0, 1].")
+        return offset
+
+    def _resolve_color(self, color: Union[str, Tuple[str, str]]) -> str:
+        """ `color` as `#rrggbb` for the current appearance mode. """
+        if isinstance(color, str) is False:
+            color = self._apply_appearance_mode(color)
+        if color.startswith("#"):
+            return color
+        if color == "transparent":
+            raise ValueError("'transparent' cannot be animated.")
+        # A Tk color name: one round-trip when the request starts, never per tick.
+        return format_color(tuple(channel >> 8 for channel in self.winfo_rgb(color)))
+
+    def _compile_tracks(self) -> None:
+        numbers, colors = [], []
+        resolution = 1
+        for name, (start, end) in self._properties.items():
+            if self._get_kind(start, name) == "number":
+                integral = isinstance(start, int) and isinstance(end, int)
+                floor = 0 if start >= 0 and end >= 0 else None
+                numbers.append(NumberTrack(name, start, end - start, integral, floor))
+                resolution = max(resolution, math.ceil(abs(end - start)))
+            else:
+                start, end = self._resolve_color(start), self._resolve_color(end)
+                steps = get_ramp_steps(start, end)
+                colors.append(ColorTrack(name, color_ramp(start, end, steps), steps))
+                resolution = max(resolution, steps)
+        self._number_tracks = tuple(numbers)
+        self._color_tracks = tuple(colors)
+        # The progress a unit (or a color level) of the longest track is worth.
+        self._resolution = resolution
+
+    def _apply(self, progress: float) -> None:
+        """ Set the options that changed at `progress`, in one `configure`. """
+        applied = self._applied
+        options = self._options
+        options.clear()
+        for name, start, span, integral, floor in self._number_tracks:
+            value = start + span * progress
+            if floor is not None and value < floor:
+                value = floor
+            value = math.floor(value + 0.5) if integral is True else round(value, self.offset_precision)
+            if applied.get(name) != value:
+                options[name] = value
+        # Overshooting springs and easings hold the end color.
+        clamped = 0.0 if progress < 0.0 else 1.0 if progress > 1.0 else progress
+        for name, ramp, steps in self._color_tracks:
+            value = ramp[int(clamped * steps + 0.5)]
+            if applied.get(name) != value:
+                options[name] = value
+        if options:
+            applied.update(options)
+            self.widget.configure(**options)
+
+    def _get_target(self, direction: Direction) -> float:
+        return 1.0 if direction is Direction.FORWARD else 0.0
+
+    def _do_animation(self, request: Request) -> None:
+        # Colors follow the appearance mode the request starts in.
+        self._compile_tracks()
+        super()._do_animation(request)
+
+    def _jump(self, request: Request) -> None:
+        self._progress = self._get_target(request.direction)
+        self._apply(self._progress)
+
+    def _compile_plan(self, direction: Direction) -> PropertyPlan:
+        if direction is Direction.FORWARD:
+            return PropertyPlan(self.forward_speed, self.forward_offset, 1, 1.0)
+        return PropertyPlan(self.backward_speed, -self.backward_offset, -1, 0.0)
+
+    def _prepare_steps(self, request: Request) -> None:
+        plan = self._get_plan(request.direction)
+        request.interval = plan.interval
+        self._step_offset = plan.offset
+        self._step_sign = plan.sign
+        self._step_bound = plan.bound
+
+    def _animation(self, request: Request) -> bool:
+        progress = self._progress + self._step_offset * self._get_owed_steps(request)
+        if (progress - self._step_bound) * self._step_sign >= 0:
+            self._progress = self._step_bound
+            self._apply(self._progress)
+            return self._finish(request)
+        self._progress = progress
+        self._apply(progress)
+        return True
+
+    def _prepare_timed(self, request: Request, previous: Optional[Request]) -> None:
+        target = self._get_target(request.direction)
+        self._start_timed_request(request, abs(target - self._progress))
+        if previous is None or previous.duration <= 0:
+            self._frames = self._compile_frames(request, self._progress, target)
+        else:
+            self._frames = self._compile_frames(request, self._progress, target, previous, self._frames)
+
+    def _timed_animation(self, request: Request) -> bool:
+        index = self._get_frame_index(request)
+        self._progress = self._frames[index]
+        self._apply(self._progress)
+        if index >= request.last_frame:
+            return self._finish(request)
+        return True
+
+    def _prepare_spring(self, request: Request, previous: Optional[Request]) -> None:
+        target = self._get_target(request.direction)
+        self._start_springs(request, ((self._progress, target, 1 / self._resolution),), previous)
+
+    def _spring_animation(self, request: Request) -> bool:
+        spring = self._springs[0]
+        elapsed = self._get_spring_elapsed(request)
+        settled = elapsed >= request.duration
+        self._progress = spring.target if settled is True else spring.position(elapsed)
+        self._apply(self._progress)
+        if settled is True:
+            return self._finish(request)
+        return True
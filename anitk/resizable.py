@@ -1,14 +1,27 @@
 import logging
-import math
+import tkinter
+from typing import NamedTuple, Optional, Tuple
 from customtkinter import CTkBaseClass
-from actkinter.base import BaseFrame, Request
-from actkinter.enums import Axis, Orientation, Direction
+from anitk.base import BaseFrame, Request
+from anitk.enums import Orientation, Direction
+from anitk.geometry import Geometry
 
 
 logger = logging.getLogger(__name__)
 
 
+class ResizePlan(NamedTuple):
+    """ Width and height steps taken together every `interval` ms until the frame is `width` x `height`. """
+    interval: int
+    hstep: float
+    vstep: float
+    width: float
+    height: float
+
+
 class ResizableFrame(BaseFrame):
+    _geometry_methods = ("_resize_widget",)
+
     def __init__(
         self,
         initial_width: float = 1,
@@ -29,6 +42,9 @@ class ResizableFrame(BaseFrame):
         orientation: Orientation = Orientation.CENTER,
         relative_expansion: bool = True,
 
+        freeze_layout: bool = False,
+        relayout_interval: Optional[float] = None,
+
         *args,
         **kwargs,
     ) -> None:
@@ -51,10 +67,31 @@ class ResizableFrame(BaseFrame):
 
         self.orientation = orientation
         self.relative_expansion = relative_expansion
-        self._incremental_offset_factor = 500
 
-        self._h_calls_counter = 0
-        self._v_calls_counter = 0
+        # With `freeze_layout`, the widget lives in `interior`, a plain frame
+        # that clips it: a tick only resizes `interior`, while the widget (and
+        # so the layout of its children) keeps its size until the animation
+        # ends, or changes every `relayout_interval` ms at most.
+        self.relayout_interval = relayout_interval
+        self._relayout_time = 0.0
+        self._layout_size = (0.0, 0.0)
+        if freeze_layout is True:
+            color = self.cget("fg_color")
+            if color == "transparent":
+                color = self.cget("bg_color")
+            self.interior: Optional[tkinter.Frame] = tkinter.Frame(
+                self,
+                width=self._actual_width,
+                height=self._actual_height,
+                bg=self._apply_appearance_mode(color),
+                highlightthickness=0,
+                borderwidth=0,
+            )
+            self.interior.grid_propagate(False)
+            self.interior.pack_propagate(False)
+        else:
+            self.interior = None
+        self._incremental_offset_factor = 500
 
         self._h_abs_distance = self._get_horizontal_distance()
         self._v_abs_distance = self._get_vertical_distance()
@@ -76,30 +113,6 @@ class ResizableFrame(BaseFrame):
         self.hbackward_animation_speed = hbackward_animation_speed
         self.vbackward_animation_speed = vbackward_animation_speed
 
-        self._h_abs_forward_required_calls = self._get_relative_required_calls(
-            self._h_abs_distance,
-            Direction.FORWARD,
-            Axis.HORIZONTAL
-        )
-
-        self._h_abs_backward_required_calls = self._get_relative_required_calls(
-            self._h_abs_distance,
-            direction=Direction.BACKWARD,
-            axis=Axis.HORIZONTAL
-        )
-
-        self._v_abs_forward_required_calls = self._get_relative_required_calls(
-            self._v_abs_distance,
-            direction=Direction.FORWARD,
-            axis=Axis.VERTICAL
-        )
-
-        self._v_abs_backward_required_calls = self._get_relative_required_calls(
-            self._v_abs_distance,
-            direction=Direction.BACKWARD,
-            axis=Axis.VERTICAL
-        )
-
         logger.debug(f"orientation:        {self.orientation}")
         logger.debug(f"relative_expansion: {self.relative_expansion}")
 
@@ -120,14 +133,8 @@ class ResizableFrame(BaseFrame):
         logger.debug(f"hbackward_offset: {self.hbackward_offset}")
         logger.debug(f"vbackward_offset: {self.vbackward_offset}")
 
-        logger.debug(f"_h_abs_forward_required_calls:  {self._h_abs_forward_required_calls}")
-        logger.debug(f"_v_abs_forward_required_calls:  {self._v_abs_forward_required_calls}")
-        logger.debug(f"_h_abs_backward_required_calls: {self._h_abs_backward_required_calls}")
-        logger.debug(f"_v_abs_backward_required_calls: {self._v_abs_backward_required_calls}")
         logger.debug(f"_h_abs_distance: {self._h_abs_distance}")
         logger.debug(f"_v_abs_distance: {self._v_abs_distance}")
-        logger.debug(f"_h_calls_counter: {self._h_calls_counter}")
-        logger.debug(f"_v_calls_counter: {self._v_calls_counter}")
 
     def _get_fps_animation_speed(self):
         result = round(1000 / (self.fps + 500))
@@ -140,6 +147,7 @@ class ResizableFrame(BaseFrame):
     @initial_width.setter
     def initial_width(self, value: float) -> None:
         self._initial_width = self._get_dimension(value, "_initial_width")
+        self._invalidate_plans()
 
     @property
     def initial_height(self) -> float:
@@ -148,6 +156,7 @@ class ResizableFrame(BaseFrame):
     @initial_height.setter
     def initial_height(self, value: float) -> None:
         self._initial_height = self._get_dimension(value, "_initial_height")
+        self._invalidate_plans()
 
     @property
     def final_width(self) -> float:
@@ -156,6 +165,7 @@ class ResizableFrame(BaseFrame):
     @final_width.setter
     def final_width(self, value: float) -> None:
         self._final_width = self._get_dimension(value, "_final_width")
+        self._invalidate_plans()
 
     @property
     def final_height(self) -> float:
@@ -164,6 +174,7 @@ class ResizableFrame(BaseFrame):
     @final_height.setter
     def final_height(self, value: float) -> None:
         self._final_height = self._get_dimension(value, "_final_height")
+        self._invalidate_plans()
 
     def _get_dimension(self, value: float, attr_name: str) -> float:
         pdimension_attr = attr_name[1:]
@@ -189,6 +200,7 @@ class ResizableFrame(BaseFrame):
     @vforward_offset.setter
     def vforward_offset(self, value: float) -> None:
         self._vforward_offset = self._get_offset(value, "_vforward_offset")
+        self._invalidate_plans()
 
     @property
     def hforward_offset(self) -> float:
@@ -197,6 +209,7 @@ class ResizableFrame(BaseFrame):
     @hforward_offset.setter
     def hforward_offset(self, value: float) -> None:
         self._hforward_offset = self._get_offset(value, "_hforward_offset")
+        self._invalidate_plans()
 
     @property
     def vbackward_offset(self) -> float:
@@ -205,6 +218,7 @@ class ResizableFrame(BaseFrame):
     @vbackward_offset.setter
     def vbackward_offset(self, value: float) -> None:
         self._vbackward_offset = self._get_offset(value, "_vbackward_offset")
+        self._invalidate_plans()
 
     @property
     def hbackward_offset(self) -> float:
@@ -213,6 +227,43 @@ class ResizableFrame(BaseFrame):
     @hbackward_offset.setter
     def hbackward_offset(self, value: float) -> None:
         self._hbackward_offset = self._get_offset(value, "_hbackward_offset")
+        self._invalidate_plans()
+
+    @property
+    def hforward_animation_speed(self) -> int:
+        return self._hforward_animation_speed
+
+    @hforward_animation_speed.setter
+    def hforward_animation_speed(self, value: int) -> None:
+        self._hforward_animation_speed = value
+        self._invalidate_plans()
+
+    @property
+    def vforward_animation_speed(self) -> int:
+        return self._vforward_animation_speed
+
+    @vforward_animation_speed.setter
+    def vforward_animation_speed(self, value: int) -> None:
+        self._vforward_animation_speed = value
+        self._invalidate_plans()
+
+    @property
+    def hbackward_animation_speed(self) -> int:
+        return self._hbackward_animation_speed
+
+    @hbackward_animation_speed.setter
+    def hbackward_animation_speed(self, value: int) -> None:
+        self._hbackward_animation_speed = value
+        self._invalidate_plans()
+
+    @property
+    def vbackward_animation_speed(self) -> int:
+        return self._vbackward_animation_speed
+
+    @vbackward_animation_speed.setter
+    def vbackward_animation_speed(self, value: int) -> None:
+        self._vbackward_animation_speed = value
+        self._invalidate_plans()
 
     def _get_offset(self, value: float, attr_name: str) -> float:
         value = float(value)
@@ -237,10 +288,10 @@ class ResizableFrame(BaseFrame):
             else:
                 div = self._v_abs_distance / self._h_abs_distance
                 offset = getattr(self, f"v{direction}_offset")
-            return round(offset / div, self.offsets_precision)
+            return round(offset / div, self.offset_precision)
 
     def _get_fps_offset(self) -> float:
-        return round(self.fps_factor / self.fps, self.offsets_precision) + 5
+        return round(self.fps_factor / self.fps, self.offset_precision) + 5
 
     @property
     def widget(self) -> CTkBaseClass:
@@ -250,9 +301,12 @@ class ResizableFrame(BaseFrame):
     def widget(self, value: CTkBaseClass) -> None:
         if not isinstance(value, CTkBaseClass):
             raise TypeError(f"Invalid input type: {type(value)}. Expected input type: CTkBaseClass")
+        if self.interior is not None and value.master is not self.interior:
+            raise ValueError("With 'freeze_layout', the widget must be created in 'interior'.")
         self._widget = value
         self._widget.configure(width=self._actual_width, height=self._actual_height)
-        self.widget.grid(row=0, column=0, sticky=self.orientation.value)
+        self._layout_size = (self._actual_width, self._actual_height)
+        self._grid_widget()
 
     def grid(self, *args, **kwargs) -> None:
         self.rowconfigure(0, weight=1)
@@ -260,7 +314,60 @@ class ResizableFrame(BaseFrame):
         super().grid(*args, **kwargs)
         self.final_width = self.cget("width")
         self.final_height = self.cget("height")
-        self.widget.grid(row=0, column=0, sticky=self.orientation.value)
+        self._grid_widget()
+        # From now on the final size follows the space the frame is given.
+        Geometry.of(self).subscribe(self._on_resize)
+
+    def _grid_widget(self) -> None:
+        if self.interior is None:
+            self.widget.grid(row=0, column=0, sticky=self.orientation.value)
+            return
+        # The widget keeps its own size inside `interior`, anchored the way
+        # `grid` would have anchored it with the same sticky value.
+        sticky = self.orientation.value
+        self.interior.grid(row=0, column=0, sticky=sticky)
+        self.widget.place(
+            relx=0.0 if "w" in sticky else 1.0 if "e" in sticky else 0.5,
+            rely=0.0 if "n" in sticky else 1.0 if "s" in sticky else 0.5,
+            anchor=sticky or "center",
+        )
+
+    def _on_resize(self, width: int, height: int) -> None:
+        """
+        The frame was given another size, which becomes its final size. A frame
+        resting at its final size follows at once; an animation heading there
+        bends its remaining path to the new size instead of snapping.
+        """
+        if width <= 1 or height <= 1:
+            return
+        width = max(self.initial_width, self._reverse_widget_scaling(width))
+        height = max(self.initial_height, self._reverse_widget_scaling(height))
+        if width == self.final_width and height == self.final_height:
+            return
+        resting = self._actual_width == self.final_width and self._actual_height == self.final_height
+        self.final_width = width
+        self.final_height = height
+        if self.interior is not None and self._handle is not None and self.relayout_interval is None:
+            self._freeze_widget()
+        request = self._request
+        if request.terminated is True:
+            if resting is True:
+                self._actual_width, self._actual_height = width, height
+                self._resize_widget(width, height)
+        elif request.direction is not Direction.BACKWARD:
+            return
+        elif self._animate == self._spring_animation:
+            # Release new springs from where the frame was last shown, at the
+            # velocity it had then.
+            request.start_time += self._spring_elapsed
+            self._start_springs(
+                request, ((self._actual_width, width, 1.0), (self._actual_height, height, 1.0)), request
+            )
+        elif self._animate == self._timed_animation:
+            self._width_frames = self._retarget_frames(request, self._width_frames, width)
+            self._height_frames = self._retarget_frames(request, self._height_frames, height)
+        else:
+            self._target_width, self._target_height = width, height
 
     @property
     def orientation(self) -> Orientation:
@@ -282,160 +389,149 @@ class ResizableFrame(BaseFrame):
             raise TypeError(f"Invalid input type: {type(value)}. Expected input type: bool")
         self._relative_expansion = value
 
-    def _clear_animation_runtime_data(self):
-        self.h_calls_counter = 0
-        self.v_calls_counter = 0
-        self.backward_required_calls = self._get_required_calls(Direction.BACKWARD)
-        self.forward_required_calls = self._get_required_calls(Direction.FORWARD)
-
-    def _get_relative_required_calls(self, distance: float, direction: Direction, axis: Axis) -> int:
-        if self._enable_animation is True:
-            attr = ResizableFrame._get_attr(direction, axis)
-            return math.ceil(distance / getattr(self, f"{attr}_offset"))
-        else:
-            return 1
-
-    def _get_required_calls(self, direction: Direction) -> int:
-        return max(
-            self._get_relative_required_calls(self._get_horizontal_distance(), direction, Axis.HORIZONTAL),
-            self._get_relative_required_calls(self._get_vertical_distance(), direction, Axis.VERTICAL)
-        )
-
     def _get_horizontal_distance(self) -> float:
         return self._final_width - self._initial_width
 
     def _get_vertical_distance(self) -> float:
         return self._final_height - self._initial_height
 
-    def _get_current_horizontal_distance(self) -> float:
-        return self._final_width - self._actual_width
-
-    def _get_current_vertical_distance(self) -> float:
-        return self._final_height - self._actual_height
-
-    def _reconfigure_widget_dimension(self, direction: Direction, axis: Axis) -> None:
-        match direction, axis:
-            case (Direction.FORWARD, Axis.HORIZONTAL):
-                if self._actual_width > self.initial_width:
-                    self._actual_width -= self.hforward_offset
-            case (Direction.BACKWARD, Axis.HORIZONTAL):
-                if self._actual_width < self.final_width:
-                    self._actual_width += self.hbackward_offset
-            case (Direction.FORWARD, Axis.VERTICAL):
-                if self._actual_height > self.initial_height:
-                    self._actual_height -= self.vforward_offset
-            case (Direction.BACKWARD, Axis.VERTICAL):
-                if self._actual_height < self.final_height:
-                    self._actual_height += self.vbackward_offset
-        self.widget.configure(width=self._actual_width, height=self._actual_height)
-        logger.debug(f"width: {self._actual_width}; height: {self._actual_height}")
-
-    def _close_operation(self, direction: Direction) -> None:
+    def _get_target(self, direction: Direction) -> Tuple[float, float]:
         if direction is Direction.FORWARD:
-            self.widget.configure(width=self.initial_width, height=self.initial_height)
+            return self.initial_width, self.initial_height
+        return self.final_width, self.final_height
+
+    def _prepare_timed(self, request: Request, previous: Optional[Request]) -> None:
+        target_width, target_height = self._get_target(request.direction)
+        remaining = 0.0
+        for span, distance in (
+            (self._get_horizontal_distance(), target_width - self._actual_width),
+            (self._get_vertical_distance(), target_height - self._actual_height),
+        ):
+            if span:
+                remaining = max(remaining, abs(distance / span))
+        self._start_timed_request(request, remaining)
+        if previous is None or previous.duration <= 0:
+            self._width_frames = self._compile_frames(request, self._actual_width, target_width)
+            self._height_frames = self._compile_frames(request, self._actual_height, target_height)
         else:
-            self.widget.configure(width=self.final_width, height=self.final_height)
-        self._h_calls_counter = 0
-        self._v_calls_counter = 0
-        super()._close_operation(direction)
-
-    def _get_animation_speed(self, direction: Direction, axis: Axis) -> int:
-        attr = ResizableFrame._get_attr(direction, axis)
-        return getattr(self, f"{attr}_animation_speed")
+            self._width_frames = self._compile_frames(
+                request, self._actual_width, target_width, previous, self._width_frames
+            )
+            self._height_frames = self._compile_frames(
+                request, self._actual_height, target_height, previous, self._height_frames
+            )
+
+    def _timed_animation(self, request: Request) -> bool:
+        index = self._get_frame_index(request)
+        self._actual_width = self._width_frames[index]
+        self._actual_height = self._height_frames[index]
+        self._resize_widget(self._actual_width, self._actual_height)
+        if index >= request.last_frame:
+            return self._finish(request)
+        return True
+
+    def _jump(self, request: Request) -> None:
+        self._actual_width, self._actual_height = self._get_target(request.direction)
+        self._resize_widget(self._actual_width, self._actual_height)
+
+    def _prepare_spring(self, request: Request, previous: Optional[Request]) -> None:
+        target_width, target_height = self._get_target(request.direction)
+        self._start_springs(
+            request,
+            ((self._actual_width, target_width, 1.0), (self._actual_height, target_height, 1.0)),
+            previous,
+        )
 
-    @staticmethod
-    def _get_attr(direction: Direction, axis: Axis) -> str:
-        match direction, axis:
-            case (Direction.FORWARD, Axis.HORIZONTAL):
-                return "hforward"
-            case (Direction.FORWARD, Axis.VERTICAL):
-                return "vforward"
-            case (Direction.BACKWARD, Axis.HORIZONTAL):
-                return "hbackward"
-            case (Direction.BACKWARD, Axis.VERTICAL):
-                return "vbackward"
-            case _:
-                raise ValueError(f"Unexpected input: {direction}; {axis}")
+    def _spring_animation(self, request: Request) -> bool:
+        width_spring, height_spring = self._springs
+        elapsed = self._get_spring_elapsed(request)
+        if elapsed >= request.duration:
+            self._actual_width, self._actual_height = width_spring.target, height_spring.target
+            self._resize_widget(self._actual_width, self._actual_height)
+            return self._finish(request)
+        # An overshooting spring may swing below zero, which Tk refuses.
+        width, height = width_spring.position(elapsed), height_spring.position(elapsed)
+        self._actual_width = width if width > 0.0 else 0.0
+        self._actual_height = height if height > 0.0 else 0.0
+        self._resize_widget(self._actual_width, self._actual_height)
+        return True
+
+    def _compile_plan(self, direction: Direction) -> ResizePlan:
+        if direction is Direction.FORWARD:
+            hms, vms = self.hforward_animation_speed, self.vforward_animation_speed
+            hoffset, voffset = self.hforward_offset, self.vforward_offset
+        else:
+            hms, vms = self.hbackward_animation_speed, self.vbackward_animation_speed
+            hoffset, voffset = self.hbackward_offset, self.vbackward_offset
+
+        # Both axes share one tick at the faster of the two speeds; the slower
+        # axis moves a proportionally smaller step so its velocity is unchanged.
+        interval = min(hms, vms)
+        width, height = self._get_target(direction)
+        return ResizePlan(interval, hoffset * interval / hms, voffset * interval / vms, width, height)
+
+    def _prepare_steps(self, request: Request) -> None:
+        # Copied to the frame: a resize may move the target of the running request.
+        plan = self._get_plan(request.direction)
+        request.interval = plan.interval
+        self._hstep, self._vstep = plan.hstep, plan.vstep
+        self._target_width, self._target_height = plan.width, plan.height
+
+    def _animation(self, request: Request) -> bool:
+        width, height = self._target_width, self._target_height
+        steps = self._get_owed_steps(request)
+        self._actual_width = ResizableFrame._approach(self._actual_width, width, self._hstep * steps)
+        self._actual_height = ResizableFrame._approach(self._actual_height, height, self._vstep * steps)
+        self._resize_widget(self._actual_width, self._actual_height)
+        logger.debug("width: %s; height: %s", self._actual_width, self._actual_height)
+
+        if self._actual_width == width and self._actual_height == height:
+            return self._finish(request)
+        return True
+
+    def _resize_widget(self, width: float, height: float) -> None:
+        if self.interior is None:
+            self.widget.configure(width=width, height=height)
+            return
+        self.interior.configure(width=width, height=height)
+        if self._handle is None:
+            # Not animating: lay the contents out right away.
+            self._layout_widget(width, height)
+        elif self.relayout_interval is not None:
+            now = self.clock.now()
+            if now >= self._relayout_time:
+                self._relayout_time = now + self.relayout_interval
+                self._layout_widget(width, height)
+
+    def _layout_widget(self, width: float, height: float) -> None:
+        """ Give the widget (and so its children) a new size, unless it already has it. """
+        if (width, height) != self._layout_size:
+            self._layout_size = (width, height)
+            self.widget.configure(width=width, height=height)
 
     def _do_animation(self, request: Request) -> None:
-        if request.direction is Direction.FORWARD:
-            vms = self.vforward_animation_speed
-            hms = self.hforward_animation_speed
-            vrc = self._v_abs_forward_required_calls
-            hrc = self._h_abs_forward_required_calls
-        else:
-            vms = self.vbackward_animation_speed
-            hms = self.hbackward_animation_speed
-            vrc = self._v_abs_backward_required_calls
-            hrc = self._h_abs_backward_required_calls
-
-        # """ absolute required calls """
-        # h_abs_distance = self._get_horizontal_distance()
-        # h_abs_required_calls = self._get_relative_required_calls(
-        #     distance=h_abs_distance, direction=request.direction, axis=Axis.HORIZONTAL
-        # )
-        # v_abs_distance = self._get_vertical_distance()
-        # v_abs_required_calls = self._get_relative_required_calls(
-        #     distance=v_abs_distance, direction=request.direction, axis=Axis.VERTICAL
-        # )
-
-        """ Relative required calls """
-        h_rel_distance = self._get_current_horizontal_distance()
-        h_rel_required_calls = self._get_relative_required_calls(
-            distance=h_rel_distance, direction=request.direction, axis=Axis.HORIZONTAL
+        if self.interior is not None and self.relayout_interval is None and self._animation_skipped() is False:
+            # Lay the contents out once at the largest size the frame reaches,
+            # so that `interior` only ever clips them.
+            self._freeze_widget()
+        super()._do_animation(request)
+
+    def _freeze_widget(self) -> None:
+        self._layout_widget(
+            self._actual_width if self._actual_width > self.final_width else self.final_width,
+            self._actual_height if self._actual_height > self.final_height else self.final_height,
         )
-        v_rel_distance = self._get_current_vertical_distance()
-        v_rel_required_calls = self._get_relative_required_calls(
-            distance=v_rel_distance, direction=request.direction, axis=Axis.VERTICAL
-        )
-
-        self._v_calls_counter = vrc - v_rel_required_calls
-        self._h_calls_counter = hrc - h_rel_required_calls
-
-        logger.debug(f"_v_calls_counter: {self._v_calls_counter}")
-        logger.debug(f"_h_calls_counter: {self._h_calls_counter}")
-
-        self.after(ms=0, func=lambda: self._animation(
-            request=request,
-            axis=Axis.VERTICAL,
-            calls_counter_attr_name="_v_calls_counter",
-            required_calls=vrc,
-            ms=vms
-        ))
-
-        self.after(ms=0, func=lambda: self._animation(
-            request=request,
-            axis=Axis.HORIZONTAL,
-            calls_counter_attr_name="_h_calls_counter",
-            required_calls=hrc,
-            ms=hms,
-        ))
-
-    def _animation(
-        self,
-        request: Request,
-        required_calls: int,
-        axis: Axis,
-        calls_counter_attr_name: str,
-        ms: int
-    ) -> None:
-        calls_counter = getattr(self, calls_counter_attr_name)
-        if request.interrupt is True:
-            request.terminated = True
-            self._next_request()
 
-        elif calls_counter >= required_calls:
-            self._close_operation(request.direction)
-            request.terminated = True
-            self._next_request()
+    def _finish(self, request: Request) -> bool:
+        if self.interior is not None and self._next_request is None:
+            self._layout_widget(self._actual_width, self._actual_height)
+        return super()._finish(request)
 
-        else:
-            setattr(self, calls_counter_attr_name, calls_counter + 1)
-            self._reconfigure_widget_dimension(request.direction, axis)
-            self.after(ms=ms, func=lambda: self._animation(
-                request=request,
-                required_calls=required_calls,
-                axis=axis,
-                calls_counter_attr_name=calls_counter_attr_name,
-                ms=ms
-            ))
+    @staticmethod
+    def _approach(value: float, target: float, step: float) -> float:
+        # Plain comparisons: builtin min()/max() allocate.
+        if value < target:
+            value += step
+            return value if value < target else target
+        value -= step
+        return value if value > target else target
@@ -1,12 +1,27 @@
 import logging
-from actkinter.base import BaseFrame, Direction, Request
-from actkinter.enums import SlideDirection
+import math
+from typing import NamedTuple, Optional, Tuple
+from anitk.base import BaseFrame, Direction, Request
+from anitk.enums import SlideDirection
+from anitk.geometry import Geometry
+from anitk.snapshot import Snapshot
 
 
 logger = logging.getLogger(__name__)
 
 
+class SlidePlan(NamedTuple):
+    """ Moves `offset` per tick along x (`horizontal`) or y, towards `bound` in the `sign` direction. """
+    interval: int
+    horizontal: bool
+    sign: int
+    offset: float
+    bound: float
+
+
 class SlideFrame(BaseFrame):
+    _geometry_methods = ("_place_rounded",)
+
     def __init__(
         self,
         xstart: float,
@@ -23,10 +38,22 @@ class SlideFrame(BaseFrame):
 
         forward_speed: int = 10,
         backward_speed: int = 10,
+
+        snapshot: bool = False,
+        pixel_planning: bool = False,
         *args,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        # Slides a captured image of the frame instead of its widget tree.
+        self.snapshot = snapshot
+        self._snapshot: Optional[Snapshot] = None
+        # Skips the ticks that would leave the frame on the same pixel.
+        self.pixel_planning = pixel_planning
+        self._pixels = 0
+        self._pixel = 0
+        self._planned_frames: Tuple[float, ...] = ()
+        self._geometry: Optional[Geometry] = None
         self.disappear = disappear
         self.automatic_scaling = automatic_scaling
         self.slide_direction = slide_direction
@@ -52,6 +79,35 @@ class SlideFrame(BaseFrame):
 
         self._place(self._xactual, self._yactual)
 
+    @property
+    def slide_direction(self) -> SlideDirection:
+        return self._slide_direction
+
+    @slide_direction.setter
+    def slide_direction(self, value: SlideDirection) -> None:
+        if isinstance(value, SlideDirection) is False:
+            raise TypeError(f"Invalid input type: {type(value)}. Expected input type: SlideDirection")
+        self._slide_direction = value
+        self._invalidate_plans()
+
+    @property
+    def xstart(self) -> float:
+        return self._xstart
+
+    @xstart.setter
+    def xstart(self, value: float) -> None:
+        self._xstart = value
+        self._invalidate_plans()
+
+    @property
+    def ystart(self) -> float:
+        return self._ystart
+
+    @ystart.setter
+    def ystart(self, value: float) -> None:
+        self._ystart = value
+        self._invalidate_plans()
+
     @property
     def xend(self) -> float:
         return self._xend
@@ -59,6 +115,7 @@ class SlideFrame(BaseFrame):
     @xend.setter
     def xend(self, value: float) -> None:
         self._xend = self._get_coordinate(value, "xend")
+        self._invalidate_plans()
 
     @property
     def yend(self) -> float:
@@ -67,6 +124,7 @@ class SlideFrame(BaseFrame):
     @yend.setter
     def yend(self, value: float) -> None:
         self._yend = self._get_coordinate(value, "yend")
+        self._invalidate_plans()
 
     def _get_coordinate(self, value: float, attr_name: str) -> float:
         coordinate_char = attr_name[0]
@@ -90,6 +148,7 @@ class SlideFrame(BaseFrame):
     @forward_offset.setter
     def forward_offset(self, offset: float) -> None:
         self._forward_offset = self._get_offset(offset)
+        self._invalidate_plans()
 
     @property
     def backward_offset(self) -> float:
@@ -98,6 +157,7 @@ class SlideFrame(BaseFrame):
     @backward_offset.setter
     def backward_offset(self, offset: float) -> None:
         self._backward_offset = self._get_offset(offset)
+        self._invalidate_plans()
 
     @property
     def forward_speed(self) -> int:
@@ -106,6 +166,7 @@ class SlideFrame(BaseFrame):
     @forward_speed.setter
     def forward_speed(self, speed: int) -> None:
         self._forward_speed = self._get_speed(speed)
+        self._invalidate_plans()
 
     @property
     def backward_speed(self) -> int:
@@ -114,10 +175,11 @@ class SlideFrame(BaseFrame):
     @backward_speed.setter
     def backward_speed(self, speed: int) -> None:
         self._backward_speed = self._get_speed(speed)
+        self._invalidate_plans()
 
     def _get_offset(self, offset: float) -> float:
         if self.override_fps is True:
-            return offset
+            return round(offset, self.offset_precision)
         else:
             return round(self.fps_factor / self.fps, self.offset_precision)
 
@@ -128,71 +190,280 @@ class SlideFrame(BaseFrame):
         return round(1000 / self.fps)
 
     def _place(self, x: float, y: float) -> None:
-        x = round(x, self.offset_precision)
-        y = round(y, self.offset_precision)
-        if self.automatic_scaling is True:
+        self._place_rounded(round(x, self.offset_precision), round(y, self.offset_precision))
+
+    def _place_rounded(self, x: float, y: float) -> None:
+        if self._snapshot is not None:
+            self._snapshot.move(x, y)
+        elif self.automatic_scaling is True:
             self.place(relx=x, rely=y, relwidth=1, relheight=1)
         else:
             self.place(relx=x, rely=y)
 
-    def _do_animation(self, request: Request) -> None:
-        if request.direction is Direction.FORWARD:
-            ms = self.forward_speed
+    def _put_request(self, direction: Direction) -> Optional[Request]:
+        request = super()._put_request(direction)
+        if self._pixels and self._handle is not None and self._next_request is not None:
+            # A sleeping chain picks the new request up on the next regular tick.
+            self._wake_on_next_tick()
+        return request
+
+    def _wake_on_next_tick(self) -> None:
+        wait = (self._request.start_time - self.clock.now()) % self._request.interval
+        self._active_scheduler.set_interval(self._handle, wait)
+
+    def _get_geometry(self) -> Geometry:
+        """ The cached size of the master, which this frame follows from now on. """
+        if self._geometry is None:
+            self._geometry = Geometry.of(self.master)
+            self._geometry.subscribe(self._on_master_resize)
+        return self._geometry
+
+    def _on_master_resize(self, width: int, height: int) -> None:
+        """ Tk moves the frame along; only the pixel-based state of a running animation is redone. """
+        if self._handle is None:
+            return
+        if self._snapshot is not None:
+            self._close_snapshot()
+        if self._pixels:
+            horizontal = self.slide_direction in (SlideDirection.LEFT, SlideDirection.RIGHT)
+            self._start_planning(self._xactual if horizontal else self._yactual)
+            if self._pixels:
+                self._wake_on_next_tick()
+
+    def _retarget(self) -> None:
+        if self._pixels:
+            # Start from where the steps slept through would have left the frame.
+            self._catch_up(self._request, self.clock.now() - self._request.interval)
+        super()._retarget()
+
+    def _catch_up(self, request: Request, now: float) -> None:
+        if self._animate == self._timed_animation:
+            progress = (now - request.start_time) / request.duration if request.duration > 0 else 1.0
+            index = int(min(1.0, max(0.0, progress)) * request.last_frame + 0.5)
+            self._xactual = self._xframes[index]
+            self._yactual = self._yframes[index]
+        elif self._step_horizontal is True:
+            self._xactual = self._take_steps(self._xactual, self._count_due_steps(request, now))
         else:
-            ms = self.backward_speed
-        self._animation(request, ms)
+            self._yactual = self._take_steps(self._yactual, self._count_due_steps(request, now))
 
-    def _animation(self, request: Request, ms: int) -> None:
-        if request.interrupt is True or self._reached(request.direction):
-            request.terminated = True
-            self._do_next_request()
+    def _do_animation(self, request: Request) -> None:
+        # Checked before the snapshot unmaps the frame.
+        if self.snapshot is True and self._snapshot is None and self._animation_skipped() is False:
+            self._take_snapshot()
+        super()._do_animation(request)
+
+    def _take_snapshot(self) -> None:
+        visibility = self._get_visibility()
+        visibility.ignore_unmaps(self, True)
+        if self.slide_direction in (SlideDirection.LEFT, SlideDirection.RIGHT):
+            path = (self.xstart, self._yactual, self.xend, self._yactual)
         else:
-            self._set_coordinates(request.direction)
-            self._place(self._xactual, self._yactual)
-            self.after(ms=ms, func=lambda: self._animation(request, ms))
+            path = (self._xactual, self.ystart, self._xactual, self.yend)
+        # The whole path, so a reversal carries on over the same overlay.
+        self._snapshot = Snapshot.take(self, path)
+        if self._snapshot is None:
+            visibility.ignore_unmaps(self, False)
+        else:
+            self._get_geometry()
+
+    def _finish(self, request: Request) -> bool:
+        if self._snapshot is not None and self._next_request is None:
+            self._close_snapshot()
+        return super()._finish(request)
+
+    def _close_snapshot(self) -> None:
+        self._snapshot.close()
+        self._snapshot = None
+        self._place_rounded(self._xactual, self._yactual)
+        self._visibility.ignore_unmaps(self, False)
+
+    def destroy(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+            self._visibility.ignore_unmaps(self, False)
+        super().destroy()
+
+    def _jump(self, request: Request) -> None:
+        self._xactual, self._yactual = self._get_target(request.direction)
+        self._place(self._xactual, self._yactual)
 
-    def _reached(self, direction: Direction) -> bool:
+    def _compile_plan(self, direction: Direction) -> SlidePlan:
+        if direction is Direction.FORWARD:
+            interval, offset = self.forward_speed, self.forward_offset
+        else:
+            interval, offset = self.backward_speed, self.backward_offset
         match self.slide_direction, direction:
             case (SlideDirection.LEFT, Direction.FORWARD):
-                return self._xactual <= self.xend
+                horizontal, sign, bound = True, -1, self.xend
             case (SlideDirection.LEFT, Direction.BACKWARD):
-                return self._xactual >= self.xstart
+                horizontal, sign, bound = True, 1, self.xstart
             case (SlideDirection.RIGHT, Direction.FORWARD):
-                return self._xactual >= self.xend
+                horizontal, sign, bound = True, 1, self.xend
             case (SlideDirection.RIGHT, Direction.BACKWARD):
-                return self._xactual <= self.xstart
+                horizontal, sign, bound = True, -1, self.xstart
             case (SlideDirection.TOP, Direction.FORWARD):
-                return self._yactual <= self.yend
+                horizontal, sign, bound = False, -1, self.yend
             case (SlideDirection.TOP, Direction.BACKWARD):
-                return self._yactual >= self.ystart
+                horizontal, sign, bound = False, 1, self.ystart
             case (SlideDirection.BOTTOM, Direction.FORWARD):
-                return self._yactual >= self.yend
+                horizontal, sign, bound = False, 1, self.yend
             case (SlideDirection.BOTTOM, Direction.BACKWARD):
-                return self._yactual <= self.ystart
+                horizontal, sign, bound = False, -1, self.ystart
+        return SlidePlan(interval, horizontal, sign, sign * offset, bound)
+
+    def _prepare_steps(self, request: Request) -> None:
+        # The running request keeps its own copy, so a tick is plain
+        # arithmetic on instance attributes.
+        plan = self._get_plan(request.direction)
+        request.interval = plan.interval
+        self._step_horizontal = plan.horizontal
+        self._step_sign = plan.sign
+        self._step_offset = plan.offset
+        self._step_bound = plan.bound
+        self._start_planning(self._xactual if plan.horizontal is True else self._yactual)
+
+    def _start_planning(self, value: float) -> None:
+        self._pixels = self._get_pixels() if self.pixel_planning is True else 0
+        self._pixel = math.floor(value * self._pixels + 0.5)
+
+    def _get_pixels(self) -> int:
+        """ Size of the master along the slide axis in pixels, 0 while it is not mapped. """
+        geometry = self._get_geometry()
+        if self.slide_direction in (SlideDirection.LEFT, SlideDirection.RIGHT):
+            size = geometry.width
+        else:
+            size = geometry.height
+        return size if size > 1 else 0
 
-    def _set_coordinates(self, direction: Direction) -> None:
-        match self.slide_direction, direction:
-            case (SlideDirection.LEFT, Direction.FORWARD):
-                if self._xactual > self.xend:
-                    self._xactual -= self.forward_offset
-            case (SlideDirection.LEFT, Direction.BACKWARD):
-                if self._xactual < self.xstart:
-                    self._xactual += self.backward_offset
-            case (SlideDirection.RIGHT, Direction.FORWARD):
-                if self._xactual < self.xend:
-                    self._xactual += self.forward_offset
-            case (SlideDirection.RIGHT, Direction.BACKWARD):
-                if self._xactual > self.xstart:
-                    self._xactual -= self.backward_offset
-            case (SlideDirection.TOP, Direction.FORWARD):
-                if self._yactual > self.yend:
-                    self._yactual -= self.forward_offset
-            case (SlideDirection.TOP, Direction.BACKWARD):
-                if self._yactual < self.ystart:
-                    self._yactual += self.backward_offset
-            case (SlideDirection.BOTTOM, Direction.FORWARD):
-                if self._yactual < self.yend:
-                    self._yactual += self.forward_offset
-            case (SlideDirection.BOTTOM, Direction.BACKWARD):
-                if self._yactual > self.ystart:
-                    self._yactual -= self.backward_offset
+    def _prepare_timed(self, request: Request, previous: Optional[Request]) -> None:
+        xtarget, ytarget = self._get_target(request.direction)
+        if self.slide_direction in (SlideDirection.LEFT, SlideDirection.RIGHT):
+            span, remaining = self.xend - self.xstart, xtarget - self._xactual
+        else:
+            span, remaining = self.yend - self.ystart, ytarget - self._yactual
+        self._start_timed_request(request, abs(remaining / span) if span else 0.0)
+        if previous is None or previous.duration <= 0:
+            self._xframes = self._compile_frames(request, self._xactual, xtarget)
+            self._yframes = self._compile_frames(request, self._yactual, ytarget)
+        else:
+            self._xframes = self._compile_frames(request, self._xactual, xtarget, previous, self._xframes)
+            self._yframes = self._compile_frames(request, self._yactual, ytarget, previous, self._yframes)
+        if self.slide_direction in (SlideDirection.LEFT, SlideDirection.RIGHT):
+            self._planned_frames = self._xframes
+            self._start_planning(self._xactual)
+        else:
+            self._planned_frames = self._yframes
+            self._start_planning(self._yactual)
+
+    def _timed_animation(self, request: Request) -> bool:
+        index = self._get_frame_index(request)
+        self._xactual = self._xframes[index]
+        self._yactual = self._yframes[index]
+        if self._pixels == 0:
+            self._place_rounded(self._xactual, self._yactual)
+        else:
+            self._plan_frames(request, index)
+        if index >= request.last_frame:
+            return self._finish(request)
+        return True
+
+    def _plan_frames(self, request: Request, index: int) -> None:
+        """ Place the frame if it changed pixel, then sleep until the frame that moves it again. """
+        frames, pixels, last = self._planned_frames, self._pixels, request.last_frame
+        pixel = math.floor(frames[index] * pixels + 0.5)
+        if pixel != self._pixel or index >= last:
+            self._pixel = pixel
+            self._place_rounded(self._xactual, self._yactual)
+        if index >= last:
+            return
+        index += 1
+        while index < last and math.floor(frames[index] * pixels + 0.5) == pixel:
+            index += 1
+        # The tick that would have shown frame `index`, as `_get_frame_index` rounds.
+        interval = request.interval
+        ticks = math.ceil((index - 0.5) * request.duration / last / interval)
+        due = request.start_time + ticks * interval
+        self._active_scheduler.set_interval(self._handle, max(interval, round(due - self.clock.now())))
+
+    def _prepare_spring(self, request: Request, previous: Optional[Request]) -> None:
+        self._pixels = 0
+        xtarget, ytarget = self._get_target(request.direction)
+        self._spring_horizontal = self.slide_direction in (SlideDirection.LEFT, SlideDirection.RIGHT)
+        # An unmapped master shows nothing: settle to the placement precision.
+        pixels = self._get_pixels()
+        pixel = 1 / pixels if pixels else 10 ** -self.offset_precision
+        if self._spring_horizontal is True:
+            self._start_springs(request, ((self._xactual, xtarget, pixel),), previous)
+        else:
+            self._start_springs(request, ((self._yactual, ytarget, pixel),), previous)
+
+    def _spring_animation(self, request: Request) -> bool:
+        spring = self._springs[0]
+        elapsed = self._get_spring_elapsed(request)
+        settled = elapsed >= request.duration
+        value = spring.target if settled is True else spring.position(elapsed)
+        if self._spring_horizontal is True:
+            self._xactual = value
+        else:
+            self._yactual = value
+        self._place(self._xactual, self._yactual)
+        if settled is True:
+            return self._finish(request)
+        return True
+
+    def _get_target(self, direction: Direction) -> Tuple[float, float]:
+        if direction is Direction.FORWARD:
+            x, y = self.xend, self.yend
+        else:
+            x, y = self.xstart, self.ystart
+        if self.slide_direction in (SlideDirection.LEFT, SlideDirection.RIGHT):
+            return x, self._yactual
+        return self._xactual, y
+
+    def _animation(self, request: Request) -> bool:
+        horizontal = self._step_horizontal
+        value = self._xactual if horizontal is True else self._yactual
+        if (value - self._step_bound) * self._step_sign >= 0:
+            return self._finish(request)
+        if self._pixels == 0:
+            value = self._take_steps(value, self._get_owed_steps(request))
+        else:
+            # Planned ticks are spaced irregularly, so count the steps by time.
+            value = self._take_steps(value, self._count_due_steps(request, self.clock.now()))
+        if horizontal is True:
+            self._xactual = value
+        else:
+            self._yactual = value
+        if self._pixels == 0:
+            # Offsets are rounded to `offset_precision`, so the position already is.
+            self._place_rounded(self._xactual, self._yactual)
+        else:
+            self._plan_steps(request, value)
+        return True
+
+    def _take_steps(self, value: float, steps: int) -> float:
+        """ `value` after up to `steps` steps, stopping at the first one that reaches the bound. """
+        while steps > 0:
+            value += self._step_offset
+            if (value - self._step_bound) * self._step_sign >= 0:
+                break
+            steps -= 1
+        return value
+
+    def _plan_steps(self, request: Request, value: float) -> None:
+        """ Place the frame if it changed pixel, then sleep for the steps it takes to move it again. """
+        offset, sign, bound, pixels = self._step_offset, self._step_sign, self._step_bound, self._pixels
+        reached = (value - bound) * sign >= 0
+        pixel = math.floor(value * pixels + 0.5)
+        if pixel != self._pixel or reached is True:
+            self._pixel = pixel
+            self._place_rounded(self._xactual, self._yactual)
+        steps = 1
+        if reached is False:
+            value += offset
+            while (value - bound) * sign < 0 and math.floor(value * pixels + 0.5) == pixel:
+                value += offset
+                steps += 1
+        self._active_scheduler.set_interval(self._handle, request.interval * steps)
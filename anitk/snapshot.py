@@ -0,0 +1,118 @@
+import logging
+import math
+import tkinter
+import _tkinter
+from typing import Optional, Tuple
+
+try:
+    from PIL import ImageGrab, ImageTk
+except ImportError:
+    ImageGrab = ImageTk = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot:
+    """
+    Stand-in for a sliding frame: images of the frame and of what lies
+    behind its path, on a Canvas over the area it sweeps. `take` returns
+    None when the frame cannot be captured, and the caller slides it live.
+    """
+
+    def __init__(
+        self,
+        canvas: tkinter.Canvas,
+        item: int,
+        images: tuple,
+        width: int,
+        height: int,
+        left: int,
+        top: int,
+    ) -> None:
+        self._canvas = canvas
+        self._item = item
+        # PhotoImages are freed by Tk as soon as Python drops them.
+        self._images = images
+        self._width = width
+        self._height = height
+        self._left = left
+        self._top = top
+
+    @classmethod
+    def take(cls, frame, path: Tuple[float, float, float, float]) -> Optional["Snapshot"]:
+        """
+        Capture `frame` and hide it behind an overlay covering `path`, the
+        `(relx, rely)` range its top-left corner may take, or return None.
+        """
+        if ImageGrab is None:
+            return None
+        master = frame.master
+        try:
+            master.update_idletasks()
+            if not frame.winfo_viewable():
+                return None
+            width, height = master.winfo_width(), master.winfo_height()
+            left, top = frame.winfo_x(), frame.winfo_y()
+            frame_width, frame_height = frame.winfo_width(), frame.winfo_height()
+            x, y = frame.winfo_rootx(), frame.winfo_rooty()
+            # A clipped frame would be grabbed with whatever covers it.
+            if (
+                left < 0 or top < 0 or left + frame_width > width or top + frame_height > height
+                or x < 0 or y < 0
+                or x + frame_width > frame.winfo_screenwidth() or y + frame_height > frame.winfo_screenheight()
+            ):
+                return None
+            content = ImageGrab.grab((x, y, x + frame_width, y + frame_height))
+            area = cls._get_area(path, width, height, frame_width, frame_height)
+            frame.place_forget()
+            cls._repaint(master)
+            x, y = master.winfo_rootx() + area[0], master.winfo_rooty() + area[1]
+            background = ImageGrab.grab((x, y, x + area[2] - area[0], y + area[3] - area[1]))
+        except (OSError, tkinter.TclError) as error:
+            logger.debug("snapshot unavailable: %s", error)
+            return None
+
+        area_left, area_top, area_right, area_bottom = area
+        images = (ImageTk.PhotoImage(background, master=master), ImageTk.PhotoImage(content, master=master))
+        canvas = tkinter.Canvas(
+            master, width=area_right - area_left, height=area_bottom - area_top, highlightthickness=0, borderwidth=0
+        )
+        canvas.create_image(0, 0, image=images[0], anchor="nw")
+        item = canvas.create_image(left - area_left, top - area_top, image=images[1], anchor="nw")
+        canvas.place(x=area_left, y=area_top)
+        return cls(canvas, item, images, width, height, area_left, area_top)
+
+    @staticmethod
+    def _get_area(
+        path: Tuple[float, float, float, float], width: int, height: int, frame_width: int, frame_height: int
+    ) -> Tuple[int, int, int, int]:
+        """ The pixels of the master the frame covers somewhere along `path`. """
+        x0, y0, x1, y1 = path
+        left, right = (x0, x1) if x0 <= x1 else (x1, x0)
+        top, bottom = (y0, y1) if y0 <= y1 else (y1, y0)
+        return (
+            max(0, math.floor(left * width)),
+            max(0, math.floor(top * height)),
+            min(width, math.ceil(right * width) + frame_width),
+            min(height, math.ceil(bottom * height) + frame_height),
+        )
+
+    @staticmethod
+    def _repaint(widget) -> None:
+        """ Wait until the display has redrawn what the unmapped frame uncovered. """
+        widget.update_idletasks()
+        # A round-trip: the display has processed the unmap once it answers.
+        widget.winfo_pointerxy()
+        while widget.tk.dooneevent(_tkinter.WINDOW_EVENTS | _tkinter.DONT_WAIT):
+            pass
+        widget.update_idletasks()
+        widget.winfo_pointerxy()
+
+    def move(self, relx: float, rely: float) -> None:
+        """ Show the frame at the position `place(relx=relx, rely=rely)` would give it. """
+        self._canvas.coords(self._item, relx * self._width - self._left, rely * self._height - self._top)
+
+    def close(self) -> None:
+        self._canvas.destroy()
+        self._images = ()
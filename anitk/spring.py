@@ -0,0 +1,140 @@
+import math
+
+
+# Bounds on the settle time search, in ms.
+_SETTLE_SEARCH_LIMIT = 600_000.0
+_SETTLE_SEARCH_ROUNDS = 48
+
+
+class Spring:
+    """
+    A damped spring, in the usual physical units: `stiffness` pulls towards
+    the target, `damping` resists the velocity and `mass` resists both.
+    Damping below `2 * sqrt(stiffness * mass)` overshoots the target.
+    """
+
+    __slots__ = ("stiffness", "damping", "mass")
+
+    def __init__(self, stiffness: float = 170.0, damping: float = 26.0, mass: float = 1.0) -> None:
+        # Without damping a spring never settles.
+        for name, value in (("stiffness", stiffness), ("damping", damping), ("mass", mass)):
+            if value <= 0:
+                raise ValueError(f"'{name}' must be a positive number.")
+        self.stiffness = float(stiffness)
+        self.damping = float(damping)
+        self.mass = float(mass)
+
+    def __repr__(self) -> str:
+        return f"Spring(stiffness={self.stiffness}, damping={self.damping}, mass={self.mass})"
+
+    def motion(self, start: float, target: float, velocity: float = 0.0) -> "SpringMotion":
+        """ The motion from `start` to `target`, leaving with `velocity` (units per ms). """
+        return SpringMotion(self, start, target, velocity)
+
+
+class SpringMotion:
+    """
+    Closed-form solution of a spring released at `start` with `velocity`:
+    the position at any time is computed directly, so a tick costs the same
+    however late it comes and nothing accumulates between ticks. Times are in
+    ms since the release.
+    """
+
+    __slots__ = ("start", "target", "_mode", "_rate", "_frequency", "_a", "_b", "_rate2")
+
+    UNDERDAMPED, CRITICAL, OVERDAMPED = 0, 1, 2
+
+    def __init__(self, spring: Spring, start: float, target: float, velocity: float = 0.0) -> None:
+        self.start = start
+        self.target = target
+        # Angular frequency in rad/ms and damping ratio.
+        natural = math.sqrt(spring.stiffness / spring.mass) / 1000
+        ratio = spring.damping / (2 * math.sqrt(spring.stiffness * spring.mass))
+        displacement = start - target
+        self._rate2 = 0.0
+        if ratio < 1:
+            # e^(-rt) (a cos(ft) + b sin(ft))
+            self._mode = SpringMotion.UNDERDAMPED
+            self._rate = ratio * natural
+            self._frequency = natural * math.sqrt(1 - ratio * ratio)
+            self._a = displacement
+            self._b = (velocity + self._rate * displacement) / self._frequency
+        elif ratio == 1:
+            # (a + bt) e^(-rt)
+            self._mode = SpringMotion.CRITICAL
+            self._rate = natural
+            self._frequency = 0.0
+            self._a = displacement
+            self._b = velocity + natural * displacement
+        else:
+            # a e^(-rt) + b e^(-r2 t), with r < r2
+            self._mode = SpringMotion.OVERDAMPED
+            root = natural * math.sqrt(ratio * ratio - 1)
+            self._rate = ratio * natural - root
+            self._rate2 = ratio * natural + root
+            self._frequency = 0.0
+            self._b = (velocity + self._rate * displacement) / (self._rate - self._rate2)
+            self._a = displacement - self._b
+
+    def position(self, time: float) -> float:
+        decay = math.exp(-self._rate * time)
+        if self._mode == SpringMotion.UNDERDAMPED:
+            angle = self._frequency * time
+            return self.target + decay * (self._a * math.cos(angle) + self._b * math.sin(angle))
+        if self._mode == SpringMotion.CRITICAL:
+            return self.target + (self._a + self._b * time) * decay
+        return self.target + self._a * decay + self._b * math.exp(-self._rate2 * time)
+
+    def velocity(self, time: float) -> float:
+        """ Units per ms. """
+        rate, decay = self._rate, math.exp(-self._rate * time)
+        if self._mode == SpringMotion.UNDERDAMPED:
+            angle, frequency = self._frequency * time, self._frequency
+            cos, sin = math.cos(angle), math.sin(angle)
+            return decay * (
+                (self._b * frequency - rate * self._a) * cos - (self._a * frequency + rate * self._b) * sin
+            )
+        if self._mode == SpringMotion.CRITICAL:
+            return (self._b - rate * (self._a + self._b * time)) * decay
+        return -rate * self._a * decay - self._rate2 * self._b * math.exp(-self._rate2 * time)
+
+    def envelope(self, time: float) -> float:
+        """ An upper bound of the distance to the target at `time`. """
+        decay = math.exp(-self._rate * time)
+        if self._mode == SpringMotion.UNDERDAMPED:
+            return math.hypot(self._a, self._b) * decay
+        if self._mode == SpringMotion.CRITICAL:
+            return (abs(self._a) + abs(self._b) * time) * decay
+        return abs(self._a) * decay + abs(self._b) * math.exp(-self._rate2 * time)
+
+    def settle_time(self, tolerance: float) -> float:
+        """
+        The time from which the motion stays within `tolerance` of the target
+        for good. Computed once per motion, so ticks only compare times.
+        """
+        if tolerance <= 0:
+            raise ValueError("'tolerance' must be a positive number.")
+        if self._mode == SpringMotion.UNDERDAMPED:
+            amplitude = math.hypot(self._a, self._b)
+            if amplitude <= tolerance:
+                return 0.0
+            return math.log(amplitude / tolerance) / self._rate
+        # The envelope may grow at first (a critically damped spring pushed
+        # away from its target), but only decreases after its peak.
+        low = 0.0
+        if self._mode == SpringMotion.CRITICAL and self._b != 0:
+            low = max(0.0, 1 / self._rate - abs(self._a) / abs(self._b))
+        if self.envelope(low) <= tolerance:
+            return low
+        high = max(low, 1.0)
+        while self.envelope(high) > tolerance:
+            if high >= _SETTLE_SEARCH_LIMIT:
+                return high
+            high *= 2
+        for _ in range(_SETTLE_SEARCH_ROUNDS):
+            middle = (low + high) / 2
+            if self.envelope(middle) > tolerance:
+                low = middle
+            else:
+                high = middle
+        return high
@@ -0,0 +1,159 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+from anitk.enums import Direction
+
+
+@dataclass
+class FrameSample:
+    scheduled: float
+    actual: float
+    interval: float
+    geometry_time: float
+
+    @property
+    def jitter(self) -> float:
+        return self.actual - self.scheduled
+
+    @property
+    def late(self) -> bool:
+        return self.jitter > self.interval / 2
+
+    @property
+    def dropped(self) -> int:
+        return int(self.jitter // self.interval) if self.interval else 0
+
+
+@dataclass
+class RequestTiming:
+    direction: Direction
+    start: float
+    end: float = 0.0
+    interrupted: bool = False
+    frames: List[FrameSample] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def late_frames(self) -> int:
+        return sum(1 for sample in self.frames if sample.late)
+
+    @property
+    def dropped_frames(self) -> int:
+        return sum(sample.dropped for sample in self.frames)
+
+    @property
+    def max_jitter(self) -> float:
+        return max((sample.jitter for sample in self.frames), default=0.0)
+
+    @property
+    def geometry_time(self) -> float:
+        return sum(sample.geometry_time for sample in self.frames)
+
+
+class AnimationStats:
+    """ Running totals over every request a frame has completed since instrumentation was enabled. """
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.interrupted = 0
+        self.frames = 0
+        self.late_frames = 0
+        self.dropped_frames = 0
+        self.total_duration = 0.0
+        self.geometry_time = 0.0
+        self.total_jitter = 0.0
+        self.max_jitter = 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        return self.total_jitter / self.frames if self.frames else 0.0
+
+    @property
+    def mean_geometry_time(self) -> float:
+        return self.geometry_time / self.frames if self.frames else 0.0
+
+    def add(self, timing: RequestTiming) -> None:
+        self.requests += 1
+        self.interrupted += timing.interrupted
+        self.frames += len(timing.frames)
+        self.late_frames += timing.late_frames
+        self.dropped_frames += timing.dropped_frames
+        self.total_duration += timing.duration
+        self.geometry_time += timing.geometry_time
+        self.total_jitter += sum(sample.jitter for sample in timing.frames)
+        self.max_jitter = max(self.max_jitter, timing.max_jitter)
+
+
+class Instrument:
+    """
+    Times the steps and geometry methods of one frame. Frames without an
+    instrument register their plain step, so disabled instrumentation costs
+    nothing per tick.
+    """
+
+    def __init__(
+        self,
+        frame,
+        on_frame: Optional[Callable[[FrameSample], None]] = None,
+        on_complete: Optional[Callable[[RequestTiming], None]] = None,
+    ) -> None:
+        self.frame = frame
+        self.on_frame = on_frame
+        self.on_complete = on_complete
+        self.stats = AnimationStats()
+        self._geometry_time = 0.0
+        self._generation = -1
+        self._timing: Optional[RequestTiming] = None
+        for name in frame._geometry_methods:
+            setattr(frame, name, self._time_geometry(getattr(frame, name)))
+
+    def _time_geometry(self, method: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._geometry_time += (time.perf_counter() - start) * 1000
+        return timed
+
+    def step(self, request, animate: Callable) -> bool:
+        clock = self.frame.clock
+        if request.generation != self._generation:
+            if self._timing is not None:
+                self._complete(clock.now(), interrupted=True)
+            self._generation = request.generation
+            self._timing = RequestTiming(request.direction, request.start_time)
+        actual = clock.now()
+        # What the scheduler expected, adaptive scaling, planned intervals and
+        # passes dropped over budget included.
+        scheduled, interval = self.frame._active_scheduler.get_schedule(self.frame._handle)
+        self._geometry_time = 0.0
+        running = animate(request)
+        sample = FrameSample(scheduled, actual, interval, self._geometry_time)
+        self._timing.frames.append(sample)
+        if self.on_frame is not None:
+            self.on_frame(sample)
+        if running is False:
+            self._complete(clock.now(), interrupted=request.interrupt)
+        return running
+
+    def close(self, request) -> None:
+        """
+        End the open timing outside of a step: the chain completed at once, was
+        dropped for `request` or the frame was destroyed.
+        """
+        if self._timing is not None:
+            interrupted = request.generation != self._generation or request.interrupt
+            self._complete(self.frame.clock.now(), interrupted=interrupted)
+
+    def _complete(self, end: float, interrupted: bool) -> None:
+        timing, self._timing = self._timing, None
+        self._generation = -1
+        timing.end = end
+        timing.interrupted = interrupted
+        self.stats.add(timing)
+        if self.on_complete is not None:
+            self.on_complete(timing)
@@ -0,0 +1,125 @@
+import logging
+from abc import abstractmethod
+from typing import List, Optional, Sequence as SequenceType, Union
+from anitk.base import BaseFrame
+from anitk.clock import FrameClock, Scheduler
+from anitk.enums import Direction
+
+
+logger = logging.getLogger(__name__)
+
+
+Member = Union[BaseFrame, "Timeline"]
+DEFAULT_INTERVAL = 16
+
+
+class Timeline(Scheduler):
+    """
+    Plays the animations of several frames (or nested timelines) as a group.
+
+    While a timeline plays, its members register their steps with the timeline
+    instead of the clock. The timeline itself owns a single clock step, so the
+    whole group costs one wakeup per frame and every member's geometry change
+    is issued from the same callback.
+    """
+
+    def __init__(self, *members: Member) -> None:
+        super().__init__()
+        if not members:
+            raise ValueError("A timeline needs at least one member.")
+        self.members: SequenceType[Member] = members
+        self._direction: Optional[Direction] = None
+        self._pending: List[Member] = []
+        self._started: List[Member] = []
+        self._start_time = 0.0
+        self._handle: Optional[int] = None
+        self._scheduler: Optional[Scheduler] = None
+
+    @property
+    def clock(self) -> FrameClock:
+        return self.members[0].clock
+
+    @property
+    def animating(self) -> bool:
+        return self._handle is not None
+
+    @property
+    def scale(self) -> float:
+        return (self._scheduler or self.clock).scale
+
+    @scale.setter
+    def scale(self, value: float) -> None:
+        """ Adaptive members follow the scale of the scheduler driving the timeline. """
+
+    def now(self) -> float:
+        return self.clock.now()
+
+    def forward(self) -> None:
+        self._play(Direction.FORWARD)
+
+    def backward(self) -> None:
+        self._play(Direction.BACKWARD)
+
+    def _play(self, direction: Direction) -> None:
+        self._direction = direction
+        self._pending = list(self.members if direction is Direction.FORWARD else reversed(self.members))
+        self._started = []
+        self._start_time = self.now()
+        for member in self.members:
+            member._scheduler = self
+        self._start_due_members(0)
+        if self._handle is None:
+            interval = self._get_interval() or DEFAULT_INTERVAL
+            self._handle = (self._scheduler or self.clock).register(self._tick, interval)
+
+    def _start(self, member: Member) -> None:
+        self._started.append(member)
+        if self._direction is Direction.FORWARD:
+            member.forward()
+        else:
+            member.backward()
+
+    @abstractmethod
+    def _start_due_members(self, elapsed: float) -> None:
+        """ Start the pending members whose turn has come. """
+
+    def _schedule(self) -> None:
+        if self._handle is not None:
+            interval = self._get_interval()
+            if interval is not None:
+                (self._scheduler or self.clock).set_interval(self._handle, interval)
+
+    def _tick(self) -> bool:
+        now = self.now()
+        self._start_due_members(now - self._start_time)
+        self._advance(now)
+        if self._pending or self._animations or any(m.animating for m in self._started):
+            return True
+        for member in self.members:
+            member._scheduler = None
+        self._handle = None
+        return False
+
+
+class Parallel(Timeline):
+    def _start_due_members(self, elapsed: float) -> None:
+        while self._pending:
+            self._start(self._pending.pop(0))
+
+
+class Sequence(Timeline):
+    def _start_due_members(self, elapsed: float) -> None:
+        while self._pending and not any(m.animating for m in self._started):
+            self._start(self._pending.pop(0))
+
+
+class Stagger(Timeline):
+    def __init__(self, *members: Member, delay: float = 50) -> None:
+        super().__init__(*members)
+        if delay < 0:
+            raise ValueError("'delay' must be a non negative number of milliseconds.")
+        self.delay = delay
+
+    def _start_due_members(self, elapsed: float) -> None:
+        while self._pending and len(self._started) * self.delay <= elapsed:
+            self._start(self._pending.pop(0))
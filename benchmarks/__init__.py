@@ -0,0 +1,10 @@
+"""
+Benchmarks for the anitk animation engines.
+
+Run them from the repository root:
+
+    python -m benchmarks                       # headless, virtual clock
+    xvfb-run python -m benchmarks --backend tk # real Tk under Xvfb
+
+Results are written as JSON (see `--output`) so they can be compared over time.
+"""
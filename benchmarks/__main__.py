@@ -0,0 +1,66 @@
+"""
+Runs the benchmark scenarios and writes their results as JSON.
+
+    python -m benchmarks [--backend virtual|tk] [--filter GLOB] [--output results.json]
+
+Every result counts the wakeups of the clock, the steps the frames ran and
+the geometry calls they issued, so batching shows as fewer wakeups or
+geometry calls per step.
+
+Scenarios that check an invariant list what broke in their "failures"; any
+failure makes the run exit with status 1.
+"""
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import time
+from benchmarks.harness import BACKENDS
+from benchmarks.scenarios import scenarios
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="virtual")
+    parser.add_argument("--filter", default="*", help="glob on the scenario names")
+    parser.add_argument("--output", default="-", help="JSON file to write, '-' for stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    failures = []
+    for name, run, *params in scenarios():
+        if not fnmatch.fnmatch(name, args.filter):
+            continue
+        backend = BACKENDS[args.backend]()
+        try:
+            result = run(backend, *params)
+        finally:
+            backend.close()
+        results.append({"name": name, **result})
+        failures.extend(f"{name}: {failure}" for failure in result.get("failures", ()))
+        print(f"{name:<28} {result['mode']:<6} {result['duration_ms']:>9.1f} ms", file=sys.stderr)
+
+    report = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": args.backend,
+        "results": results,
+        "failures": failures,
+    }
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    for failure in failures:
+        print(f"invariant broken: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
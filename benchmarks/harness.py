@@ -0,0 +1,438 @@
+import contextlib
+import heapq
+import itertools
+import time
+import tkinter
+import types
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterator, List, Tuple, Type
+from anitk.base import BaseFrame, Frame
+from anitk.clock import FrameClock
+
+
+class VirtualClock:
+    """ A deterministic stand-in for Tk's timer queue: `after` callbacks run in due order and time jumps. """
+
+    def __init__(self) -> None:
+        self.time = 0.0
+        self.charge_cpu = False
+        self._queue: List[Tuple[float, int, str, Callable[[], None]]] = []
+        self._cancelled = set()
+        self._ids = itertools.count()
+        self.wakeups = 0
+
+    def timer(self) -> float:
+        return self.time / 1000
+
+    def after(self, ms: int, func: Callable[[], None]) -> str:
+        number = next(self._ids)
+        after_id = f"after#{number}"
+        heapq.heappush(self._queue, (self.time + ms, number, after_id, func))
+        return after_id
+
+    def after_cancel(self, after_id: str) -> None:
+        self._cancelled.add(after_id)
+
+    def run(self, until: Callable[[], bool] = lambda: False, limit: int = 10_000_000) -> None:
+        while self._queue and limit > 0 and until() is False:
+            due, _, after_id, func = heapq.heappop(self._queue)
+            if after_id in self._cancelled:
+                self._cancelled.discard(after_id)
+                continue
+            self.time = max(self.time, due)
+            self.wakeups += 1
+            limit -= 1
+            start = time.perf_counter()
+            func()
+            if self.charge_cpu is True:
+                self.time += (time.perf_counter() - start) * 1000
+
+
+class VirtualRoot:
+    """
+    The subset of a Tk root the clock uses: `after`, `register` and `tk.call("after", ...)`,
+    plus its size and `<Configure>` bindings for the frames that follow their master's geometry.
+    """
+
+    _w = "."
+
+    def __init__(self, clock: VirtualClock, width: int = 800, height: int = 600) -> None:
+        self.clock = clock
+        self.tk = self
+        self.width = width
+        self.height = height
+        self._commands: Dict[str, Callable[[], None]] = {}
+        self._bindings: Dict[str, List[Callable]] = {}
+
+    def _bind(self, what, sequence: str, func: Callable, add, needcleanup: int = 1) -> None:
+        """ What `tkinter.Misc.bind` calls. """
+        handlers = self._bindings.setdefault(sequence, [])
+        if not add:
+            handlers.clear()
+        handlers.append(func)
+
+    def __str__(self) -> str:
+        return self._w
+
+    def set_mapped(self, widget, mapped: bool) -> None:
+        """ Fire `<Map>` or `<Unmap>` for `widget` (the root itself when iconified). """
+        event = types.SimpleNamespace(widget=widget)
+        for handler in list(self._bindings.get("<Map>" if mapped is True else "<Unmap>", ())):
+            handler(event)
+
+    def resize(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        event = types.SimpleNamespace(widget=self, width=width, height=height)
+        for handler in list(self._bindings.get("<Configure>", ())):
+            handler(event)
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    def after(self, ms: int, func: Callable[[], None]) -> str:
+        return self.clock.after(ms, func)
+
+    def after_cancel(self, after_id: str) -> None:
+        self.clock.after_cancel(after_id)
+
+    def register(self, func: Callable[[], None]) -> str:
+        name = f"command{len(self._commands)}"
+        self._commands[name] = func
+        return name
+
+    def call(self, command: str, *args):
+        if command != "after":
+            # What Tk answers for a command it does not know.
+            raise tkinter.TclError(f'invalid command name "{command}"')
+        if args[0] == "cancel":
+            return self.clock.after_cancel(args[1])
+        return self.clock.after(args[0], self._commands[args[1]])
+
+
+class Recorder:
+    """ Counts the geometry calls issued by the frames of a benchmark run, and their steps apart. """
+
+    def __init__(self) -> None:
+        self.calls: Dict[str, int] = {}
+        self.steps = 0
+        self.cost_ms = 0.0
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.steps = 0
+
+    def step(self) -> None:
+        self.steps += 1
+
+    def record(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.cost_ms:
+            end = time.perf_counter() + self.cost_ms / 1000
+            while time.perf_counter() < end:
+                pass
+
+    @property
+    def geometry_calls(self) -> int:
+        return sum(self.calls.values())
+
+
+class VirtualWidget:
+    """ A headless plain Tk widget made by a frame; its `configure` calls are recorded apart. """
+
+    def __init__(self, master, **options) -> None:
+        self.master = master
+        self.tk = self
+        self._w = f"{master._w}.!{type(self).__name__.lower()}"
+        self._recorder: Recorder = master._recorder
+
+    def configure(self, *args, **kwargs) -> None:
+        self._recorder.record(f"{type(self).__name__.lower()}.configure")
+
+    def _noop(self, *args, **kwargs) -> None:
+        """ """
+
+    grid = place = grid_propagate = pack_propagate = _noop
+
+
+class VirtualCanvas(VirtualWidget):
+    """ A headless Canvas: items are numbered and every script sent to Tk is recorded as one call. """
+
+    def __init__(self, master, **options) -> None:
+        super().__init__(master, **options)
+        self._items = itertools.count(1)
+
+    def create_rectangle(self, *args, **kwargs) -> int:
+        return next(self._items)
+
+    def eval(self, script: str) -> str:
+        self._recorder.record("eval")
+        return ""
+
+
+class RecordingWidget:
+    """ Mixin that records `place`/`configure` and, when headless, stands in for the Tk widget. """
+
+    _recorder: Recorder
+    _virtual_root = None
+
+    def place(self, *args, **kwargs) -> None:
+        self._recorder.record("place")
+        if self._virtual_root is None:
+            super().place(*args, **kwargs)
+
+    def configure(self, *args, **kwargs) -> None:
+        self._recorder.record("configure")
+        if self._virtual_root is None:
+            super().configure(*args, **kwargs)
+        else:
+            self._options.update(kwargs)
+
+    def cget(self, key: str):
+        if self._virtual_root is None:
+            return super().cget(key)
+        return self._options.get(key)
+
+    def _root(self):
+        if self._virtual_root is None:
+            return super()._root()
+        return self._virtual_root
+
+    def after(self, ms, func=None, *args):
+        if self._virtual_root is None:
+            return super().after(ms, func, *args)
+        return self._virtual_root.after(ms, func)
+
+    def after_cancel(self, after_id) -> None:
+        if self._virtual_root is None:
+            super().after_cancel(after_id)
+        else:
+            self._virtual_root.after_cancel(after_id)
+
+    def winfo_width(self) -> int:
+        return 800 if self._virtual_root is not None else super().winfo_width()
+
+    def winfo_height(self) -> int:
+        return 600 if self._virtual_root is not None else super().winfo_height()
+
+    def _apply_appearance_mode(self, color):
+        return color if self._virtual_root is not None else super()._apply_appearance_mode(color)
+
+    def _reverse_widget_scaling(self, value):
+        return value if self._virtual_root is not None else super()._reverse_widget_scaling(value)
+
+
+def _headless_noop(name: str):
+    def method(self, *args, **kwargs):
+        if self._virtual_root is None:
+            return getattr(super(RecordingWidget, self), name)(*args, **kwargs)
+    method.__name__ = name
+    return method
+
+
+for _name in ("grid", "grid_rowconfigure", "grid_columnconfigure", "rowconfigure", "columnconfigure", "bind", "_bind"):
+    setattr(RecordingWidget, _name, _headless_noop(_name))
+
+
+_recording_classes: Dict[type, type] = {}
+
+
+def _counting(step: Callable[..., bool]) -> Callable[..., bool]:
+    # Calls the step function directly: `super()` would allocate on every tick.
+    def counted(self) -> bool:
+        self._recorder.step()
+        return step(self)
+    counted.__name__ = step.__name__
+    return counted
+
+
+def recording_class(cls: Type) -> Type:
+    if cls not in _recording_classes:
+        namespace = {
+            name: _counting(getattr(cls, name))
+            for name in ("_step", "_instrumented_step")
+            if hasattr(cls, name)
+        }
+        _recording_classes[cls] = type(f"Recording{cls.__name__}", (RecordingWidget, cls), namespace)
+    return _recording_classes[cls]
+
+
+@contextlib.contextmanager
+def _without_tk() -> Iterator[None]:
+    init, destroy = Frame.__init__, Frame.destroy
+    canvas, frame = tkinter.Canvas, tkinter.Frame
+    Frame.__init__ = lambda self, *args, **kwargs: None
+    Frame.destroy = lambda self: None
+    # The plain Tk widgets the frames build inside themselves.
+    tkinter.Canvas, tkinter.Frame = VirtualCanvas, VirtualWidget
+    try:
+        yield
+    finally:
+        Frame.__init__, Frame.destroy = init, destroy
+        tkinter.Canvas, tkinter.Frame = canvas, frame
+
+
+class Backend(ABC):
+    name = ""
+
+    def __init__(self) -> None:
+        self.recorder = Recorder()
+        self.tick_times: List[float] = []
+
+    @abstractmethod
+    def create(self, cls: Type, **kwargs):
+        """ A recording instance of `cls`, in the root unless `master` is given. """
+
+    @abstractmethod
+    def destroy(self, widget) -> None:
+        """ Destroy `widget` the way an application would. """
+
+    @abstractmethod
+    def now(self) -> float:
+        """ Current time in milliseconds. """
+
+    @abstractmethod
+    def after(self, ms: int, func: Callable[[], None]) -> None:
+        """ Call `func` in `ms` milliseconds. """
+
+    @abstractmethod
+    def run(self, until: Callable[[], bool]) -> None:
+        """ Process events until `until()` is True. """
+
+    @abstractmethod
+    def resize(self, width: int, height: int) -> None:
+        """ Resize the root the frames are placed in. """
+
+    @abstractmethod
+    def iconify(self) -> None:
+        """ Hide the root as minimizing its window would. """
+
+    @abstractmethod
+    def deiconify(self) -> None:
+        """ Show the root again. """
+
+    @property
+    def wakeups(self) -> int:
+        return len(self.tick_times)
+
+    def _instrument(self, clock: FrameClock) -> None:
+        if "_tick" in vars(clock):
+            return
+        tick = clock._tick
+
+        def timed_tick() -> None:
+            start = time.perf_counter()
+            tick()
+            self.tick_times.append(time.perf_counter() - start)
+
+        clock._tick = timed_tick
+
+    def close(self) -> None:
+        """ """
+
+
+class VirtualBackend(Backend):
+    name = "virtual"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.virtual_clock = VirtualClock()
+        self.root = VirtualRoot(self.virtual_clock)
+        self._widget_ids = itertools.count()
+        self.clock = FrameClock(self.root, timer=self.virtual_clock.timer)
+        FrameClock._clocks[self.root] = self.clock
+        self._instrument(self.clock)
+
+    def create(self, cls: Type, **kwargs):
+        recording = recording_class(cls)
+        with _without_tk():
+            widget = recording.__new__(recording)
+            widget._recorder = self.recorder
+            widget._virtual_root = self.root
+            widget.master = kwargs.pop("master", self.root)
+            widget._w = f".!{cls.__name__.lower()}{next(self._widget_ids)}"
+            widget._options = {}
+            widget.__init__(**kwargs)
+        return widget
+
+    def destroy(self, widget) -> None:
+        with _without_tk():
+            widget.destroy()
+
+    def now(self) -> float:
+        return self.virtual_clock.time
+
+    def after(self, ms: int, func: Callable[[], None]) -> None:
+        self.virtual_clock.after(ms, func)
+
+    def run(self, until: Callable[[], bool]) -> None:
+        self.virtual_clock.run(until)
+
+    def resize(self, width: int, height: int) -> None:
+        self.root.resize(width, height)
+
+    def iconify(self) -> None:
+        self.root.set_mapped(self.root, False)
+
+    def deiconify(self) -> None:
+        self.root.set_mapped(self.root, True)
+
+
+class TkBackend(Backend):
+    name = "tk"
+
+    def __init__(self) -> None:
+        super().__init__()
+        import customtkinter
+        self.root = customtkinter.CTk()
+        self.root.geometry("1024x768")
+        self._instrument(FrameClock.of(self.root))
+
+    def create(self, cls: Type, **kwargs):
+        recording = recording_class(cls)
+        widget = recording.__new__(recording)
+        widget._recorder = self.recorder
+        kwargs.setdefault("master", self.root)
+        widget.__init__(**kwargs)
+        return widget
+
+    def destroy(self, widget) -> None:
+        widget.destroy()
+
+    def now(self) -> float:
+        return time.perf_counter() * 1000
+
+    def after(self, ms: int, func: Callable[[], None]) -> None:
+        self.root.after(ms, func)
+
+    def run(self, until: Callable[[], bool]) -> None:
+        while until() is False:
+            self.root.update()
+
+    def resize(self, width: int, height: int) -> None:
+        self.root.geometry(f"{width}x{height}")
+        self.root.update()
+
+    def iconify(self) -> None:
+        self.root.iconify()
+        self.root.update()
+
+    def deiconify(self) -> None:
+        self.root.deiconify()
+        self.root.update()
+
+    def close(self) -> None:
+        self.root.destroy()
+
+
+BACKENDS: Dict[str, Type[Backend]] = {
+    VirtualBackend.name: VirtualBackend,
+    TkBackend.name: TkBackend,
+}
+
+
+def all_terminated(frames: List[BaseFrame]) -> Callable[[], bool]:
+    return lambda: not any(frame.animating for frame in frames)
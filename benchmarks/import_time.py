@@ -0,0 +1,81 @@
+"""
+Cold-start import benchmark.
+
+    python -m benchmarks.import_time [--budget-ms 30] [--output results.json]
+
+Each module is imported in a fresh interpreter; the time reported is the
+import cost on top of an interpreter that imports nothing. Exits non-zero
+when a module is over budget or when `anitk` / `anitk.enums` drag in
+customtkinter.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import List
+
+
+MODULES = ("anitk", "anitk.enums", "anitk.slider")
+LIGHTWEIGHT_MODULES = ("anitk", "anitk.enums")
+DEFAULT_BUDGET_MS = 30.0
+REPEAT = 5
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = (time.perf_counter() - start) * 1000
+print(elapsed, "customtkinter" in sys.modules)
+"""
+
+
+def _probe(statement: str) -> List[str]:
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return output.split()
+
+
+def measure(module: str, repeat: int = REPEAT) -> dict:
+    baseline = statistics.median(float(_probe("pass")[0]) for _ in range(repeat))
+    samples = [_probe(f"import {module}") for _ in range(repeat)]
+    return {
+        "module": module,
+        "import_ms": statistics.median(float(elapsed) for elapsed, _ in samples) - baseline,
+        "imports_customtkinter": samples[0][1] == "True",
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time", description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--output", default="-", help="JSON file to write, '-' for stdout")
+    args = parser.parse_args(argv)
+
+    failures = []
+    results = [measure(module) for module in MODULES]
+    for result in results:
+        if result["module"] in LIGHTWEIGHT_MODULES:
+            if result["imports_customtkinter"] is True:
+                failures.append(f"{result['module']} imports customtkinter")
+            if result["import_ms"] > args.budget_ms:
+                failures.append(f"{result['module']} took {result['import_ms']:.1f} ms")
+
+    report = {"budget_ms": args.budget_ms, "results": results, "failures": failures}
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    for failure in failures:
+        print(f"over budget: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
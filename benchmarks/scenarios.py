@@ -0,0 +1,589 @@
+import gc
+import statistics
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional
+from anitk import BaseFrame, CanvasSlideFrame, Priority, PropertyFrame, ResizableFrame, SlideDirection, SlideFrame, Spring, Stagger
+from anitk.base import Frame
+from benchmarks.harness import Backend, Recorder, all_terminated
+
+
+FRAME_COUNTS = (1, 10, 100, 1000)
+TOGGLE_FRAME_COUNTS = (10, 100)
+TOGGLES = 20
+TOGGLE_INTERVAL = 16
+TIMELINE_FRAME_COUNT = 20
+OVERLOAD_FRAME_COUNT = 100
+OVERLOAD_GEOMETRY_COST = 0.25
+STAGGER_DELAY = 20
+DURATION = 250
+PIXEL_FRAME_COUNT = 100
+PIXEL_PARENT_SIZE = (160, 120)
+PIXEL_OFFSET = 0.0005
+WINDOW_RESIZES = 10
+WINDOW_RESIZE_INTERVAL = 50
+SPRING_FRAME_COUNT = 100
+SPRING_REVERSAL_DELAY = 150
+CANVAS_ITEM_COUNTS = (100, 2000)
+CANVAS_COLUMNS = 50
+CANVAS_TILE_SIZE = 16
+CANVAS_DISTANCE = 200
+HIDE_DELAY = 50
+FROZEN_FRAME_COUNT = 100
+RELAYOUT_INTERVAL = 100
+THREADED_FRAME_COUNT = 100
+THREADED_WORKERS = 4
+THREADED_POSTS = 1000
+BUDGET = 8
+LIFECYCLE_FRAME_COUNT = 10_000
+HAMMER_FRAME_COUNT = 100
+PROPERTY_FRAME_COUNT = 100
+RESIZABLE_COLUMNS = 10
+PROPERTIES = {
+    "fg_color": ("#1f1f1f", "#3b8ed0"),
+    "border_color": ("#565b5e", "#ffffff"),
+    "corner_radius": (0, 12),
+    "border_width": (0, 4),
+}
+HAMMER_ROUNDS = 50
+REUSE_FRAME_COUNT = 100
+REUSE_ROUNDS = 10
+HAMMER_CALLS = 10
+LIFECYCLE_BATCH = 100
+LIFECYCLE_DELAY = 50
+BUDGET_FOREGROUND_SHARE = 0.1
+
+
+def _create_slide_frames(backend: Backend, count: int, duration: Optional[float], **options) -> List[SlideFrame]:
+    return [
+        backend.create(
+            SlideFrame,
+            xstart=0.5,
+            ystart=0,
+            xend=0.2,
+            yend=0,
+            slide_direction=SlideDirection.RIGHT,
+            disappear=True,
+            duration=duration,
+            **options,
+        )
+        for _ in range(count)
+    ]
+
+
+def _create_resizable_frames(backend: Backend, count: int, duration: Optional[float], **options) -> List[ResizableFrame]:
+    frames = []
+    for index in range(count):
+        frame = backend.create(ResizableFrame, opened=True, duration=duration, **options)
+        frame.widget = backend.create(Frame, master=frame if frame.interior is None else frame.interior)
+        frame.grid(row=index // RESIZABLE_COLUMNS, column=index % RESIZABLE_COLUMNS)
+        frame.backward()
+        frames.append(frame)
+    backend.run(all_terminated(frames))
+    return frames
+
+
+CREATORS: Dict[str, Callable] = {
+    "slide": _create_slide_frames,
+    "resize": _create_resizable_frames,
+}
+
+
+def _summary(backend: Backend, frames: list, start: float, wakeups: int, ticks: int, **extra) -> dict:
+    recorder: Recorder = backend.recorder
+    tick_times = [t * 1000 for t in backend.tick_times[ticks:]]
+    frame_wakeups = backend.wakeups - wakeups
+    return {
+        "backend": backend.name,
+        "frames": len(frames),
+        **extra,
+        "wakeups": frame_wakeups,
+        "geometry_calls": recorder.geometry_calls,
+        "geometry_calls_per_animation": recorder.geometry_calls / len(frames),
+        "steps": recorder.steps,
+        "steps_per_animation": recorder.steps / len(frames),
+        "geometry_calls_per_wakeup": recorder.geometry_calls / frame_wakeups if frame_wakeups else 0,
+        "python_ms_per_wakeup": statistics.fmean(tick_times) if tick_times else 0,
+        "python_ms_per_wakeup_max": max(tick_times, default=0),
+        "duration_ms": backend.now() - start,
+    }
+
+
+def run_animation(backend: Backend, engine: str, count: int, duration: Optional[float]) -> dict:
+    frames = CREATORS[engine](backend, count, duration)
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    for frame in frames:
+        frame.forward()
+    backend.run(all_terminated(frames))
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="animation", engine=engine, mode="step" if duration is None else "timed",
+    )
+
+
+def run_toggle(backend: Backend, engine: str, count: int, duration: Optional[float]) -> dict:
+    frames = CREATORS[engine](backend, count, duration)
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    pending = [TOGGLES]
+
+    def toggle() -> None:
+        for frame in frames:
+            frame.do_animation()
+        pending[0] -= 1
+        if pending[0] > 0:
+            backend.after(TOGGLE_INTERVAL, toggle)
+
+    toggle()
+    backend.run(lambda: pending[0] == 0 and all_terminated(frames)())
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="toggle", engine=engine, mode="step" if duration is None else "timed",
+        toggles=TOGGLES,
+    )
+
+
+def run_timeline(backend: Backend, engine: str, count: int, duration: Optional[float]) -> dict:
+    frames = CREATORS[engine](backend, count, duration)
+    timeline = Stagger(*frames, delay=STAGGER_DELAY)
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    timeline.forward()
+    backend.run(lambda: not timeline.animating)
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="timeline", engine=engine, mode="step" if duration is None else "timed",
+    )
+
+
+def run_overload(backend: Backend, engine: str, count: int, duration: Optional[float], adaptive: bool) -> dict:
+    """ Every geometry call burns OVERLOAD_GEOMETRY_COST ms, so a wakeup costs more than a frame. """
+    frames = CREATORS[engine](backend, count, duration)
+    for frame in frames:
+        frame.adaptive = adaptive
+    backend.recorder.reset()
+    backend.recorder.cost_ms = OVERLOAD_GEOMETRY_COST
+    if hasattr(backend, "virtual_clock"):
+        backend.virtual_clock.charge_cpu = True
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    for frame in frames:
+        frame.forward()
+    backend.run(all_terminated(frames))
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="overload", engine=engine, mode="step" if duration is None else "timed",
+        adaptive=adaptive,
+    )
+
+
+def run_budget(backend: Backend, engine: str, count: int, duration: Optional[float], budget: Optional[float]) -> dict:
+    """
+    The overload scenario with priorities: a tenth of the frames in the
+    foreground, the others split between background and idle. With a clock
+    `budget`, a wakeup should stay close to it instead of running every step.
+    """
+    frames = CREATORS[engine](backend, count, duration)
+    foreground = int(count * BUDGET_FOREGROUND_SHARE)
+    for index, frame in enumerate(frames):
+        if index >= foreground:
+            frame.priority = Priority.BACKGROUND if index % 2 == 0 else Priority.IDLE
+    clock = frames[0].clock
+    clock.budget = budget
+    backend.recorder.reset()
+    backend.recorder.cost_ms = OVERLOAD_GEOMETRY_COST
+    if hasattr(backend, "virtual_clock"):
+        backend.virtual_clock.charge_cpu = True
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    try:
+        for frame in frames:
+            frame.forward()
+        backend.run(all_terminated(frames))
+    finally:
+        clock.budget = None
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="budget", engine=engine, mode="step" if duration is None else "timed",
+        budget=budget, dropped_frames=clock.dropped_frames,
+    )
+
+
+def run_pixel_planning(backend: Backend, count: int, duration: Optional[float], planning: bool) -> dict:
+    """ Slow slides in a small parent, where most steps stay on the same pixel. """
+    backend.resize(*PIXEL_PARENT_SIZE)
+    frames = _create_slide_frames(
+        backend, count, duration,
+        pixel_planning=planning,
+        override_fps=True,
+        forward_offset=PIXEL_OFFSET,
+        backward_offset=PIXEL_OFFSET,
+    )
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    for frame in frames:
+        frame.forward()
+    backend.run(all_terminated(frames))
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="pixels", engine="slide", mode="step" if duration is None else "timed",
+        pixel_planning=planning,
+    )
+
+
+def run_window_resize(backend: Backend, count: int, duration: Optional[float]) -> dict:
+    """ Planned slides while the window keeps switching between two sizes. """
+    backend.resize(*PIXEL_PARENT_SIZE)
+    frames = _create_slide_frames(
+        backend, count, duration,
+        pixel_planning=True,
+        override_fps=True,
+        forward_offset=PIXEL_OFFSET,
+        backward_offset=PIXEL_OFFSET,
+    )
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    pending = [WINDOW_RESIZES]
+
+    def resize() -> None:
+        width, height = PIXEL_PARENT_SIZE
+        scale = 2 if pending[0] % 2 else 1
+        backend.resize(width * scale, height * scale)
+        pending[0] -= 1
+        if pending[0] > 0:
+            backend.after(WINDOW_RESIZE_INTERVAL, resize)
+
+    for frame in frames:
+        frame.forward()
+    backend.after(WINDOW_RESIZE_INTERVAL, resize)
+    backend.run(lambda: pending[0] == 0 and all_terminated(frames)())
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="window-resize", engine="slide", mode="step" if duration is None else "timed",
+        resizes=WINDOW_RESIZES,
+    )
+
+
+def run_spring(backend: Backend, engine: str, count: int) -> dict:
+    """ Spring animations reversed mid-way, so every frame retargets with its velocity. """
+    frames = CREATORS[engine](backend, count, None, spring=Spring())
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+
+    def reverse() -> None:
+        for frame in frames:
+            frame.backward()
+
+    for frame in frames:
+        frame.forward()
+    backend.after(SPRING_REVERSAL_DELAY, reverse)
+    backend.run(lambda: backend.now() - start > SPRING_REVERSAL_DELAY and all_terminated(frames)())
+    return _summary(backend, frames, start, wakeups, ticks, scenario="spring", engine=engine, mode="spring")
+
+
+def run_canvas(backend: Backend, count: int, duration: Optional[float]) -> dict:
+    """ A wall of `count` tiles sliding on one Canvas, animated by a single frame. """
+    frame = backend.create(CanvasSlideFrame, duration=duration)
+    starts = [
+        ((i % CANVAS_COLUMNS) * CANVAS_TILE_SIZE, (i // CANVAS_COLUMNS) * CANVAS_TILE_SIZE)
+        for i in range(count)
+    ]
+    items = [frame.canvas.create_rectangle(x, y, x + CANVAS_TILE_SIZE, y + CANVAS_TILE_SIZE) for x, y in starts]
+    frame.add(items, starts, [(x + CANVAS_DISTANCE, y) for x, y in starts])
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    frame.forward()
+    backend.run(all_terminated([frame]))
+    return _summary(
+        backend, [frame], start, wakeups, ticks,
+        scenario="canvas", engine="canvas", mode="step" if duration is None else "timed",
+        items=count,
+    )
+
+
+def run_hidden(backend: Backend, engine: str, count: int, duration: Optional[float], how: str) -> dict:
+    """
+    Animations that nobody sees: the window is iconified mid-way, or low-power
+    mode is on from the start. Either way they should complete at once.
+    """
+    frames = CREATORS[engine](backend, count, duration)
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    BaseFrame.low_power = how == "low-power"
+    try:
+        for frame in frames:
+            frame.forward()
+        if how == "iconify":
+            backend.after(HIDE_DELAY, backend.iconify)
+        backend.run(all_terminated(frames))
+    finally:
+        BaseFrame.low_power = False
+    result = _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="hidden", engine=engine, mode="step" if duration is None else "timed",
+        hidden=how,
+    )
+    if how == "iconify":
+        backend.deiconify()
+    return result
+
+
+def run_frozen(backend: Backend, count: int, duration: Optional[float], relayout_interval: Optional[float]) -> dict:
+    """ ResizableFrames whose contents are laid out once (or every RELAYOUT_INTERVAL ms) per animation. """
+    frames = _create_resizable_frames(
+        backend, count, duration, freeze_layout=True, relayout_interval=relayout_interval
+    )
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    for frame in frames:
+        frame.forward()
+    backend.run(all_terminated(frames))
+    result = _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="frozen", engine="resize", mode="step" if duration is None else "timed",
+        relayout_interval=relayout_interval,
+    )
+    result["widget_layouts"] = backend.recorder.calls.get("configure", 0)
+    return result
+
+
+def run_threaded(backend: Backend, engine: str, count: int, duration: Optional[float]) -> dict:
+    """
+    Worker threads post THREADED_POSTS alternating requests each, for their
+    share of the frames, while the Tk thread runs; each ends on `forward`.
+    """
+    frames = CREATORS[engine](backend, count, duration, threadsafe=True)
+    delivered = [0]
+    for frame in frames:
+        def put_request(direction, put_request=frame._put_request):
+            delivered[0] += 1
+            return put_request(direction)
+        frame._put_request = put_request
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+
+    def work(frames: list) -> None:
+        for post in range(THREADED_POSTS):
+            for frame in frames:
+                if post % 2 == 0:
+                    frame.backward_threadsafe()
+                else:
+                    frame.forward_threadsafe()
+
+    workers = [
+        threading.Thread(target=work, args=(frames[index::THREADED_WORKERS],))
+        for index in range(THREADED_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    clock = frames[0].clock
+    backend.run(lambda: (
+        not any(worker.is_alive() for worker in workers) and not clock._posts and all_terminated(frames)()
+    ))
+    for worker in workers:
+        worker.join()
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="threaded", engine=engine, mode="step" if duration is None else "timed",
+        posted=THREADED_POSTS * count, delivered=delivered[0],
+    )
+
+
+def run_lifecycle(backend: Backend, engine: str, count: int, duration: Optional[float]) -> dict:
+    """
+    Panels created and destroyed all day: batches of frames are destroyed
+    LIFECYCLE_DELAY ms into their animation. Nothing may tick afterwards and
+    none of them may stay alive. The virtual backend skips Tk's own
+    `Frame.destroy`, so only the tk backend covers the widget teardown.
+    """
+    references = []
+    still_animating = 0
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    for _ in range(count // LIFECYCLE_BATCH):
+        frames = CREATORS[engine](backend, LIFECYCLE_BATCH, duration)
+        clock = frames[0].clock
+        for frame in frames:
+            frame.forward()
+        stop = backend.now() + LIFECYCLE_DELAY
+        backend.run(lambda: backend.now() >= stop)
+        for frame in frames:
+            backend.destroy(frame)
+            still_animating += frame.animating
+            references.append(weakref.ref(frame))
+        del frames, frame
+        gc.collect()
+    result = _summary(
+        backend, references, start, wakeups, ticks,
+        scenario="lifecycle", engine=engine, mode="step" if duration is None else "timed",
+    )
+    result["alive_frames"] = sum(1 for reference in references if reference() is not None)
+    result["still_animating"] = still_animating
+    result["clock_idle"] = clock.idle
+    result["failures"] = [
+        f"{name} is {result[name]}"
+        for name, expected in (("alive_frames", 0), ("still_animating", 0), ("clock_idle", True))
+        if result[name] != expected
+    ]
+    return result
+
+
+def run_hammer(backend: Backend, engine: str, count: int, duration: Optional[float], ignore_inputs: bool) -> dict:
+    """
+    Every TOGGLE_INTERVAL ms, each frame gets HAMMER_CALLS mixed `forward`,
+    `backward` and `do_animation` calls. However they land, a frame must never
+    have more than one step registered with the clock.
+    """
+    frames = CREATORS[engine](backend, count, duration, ignore_inputs=ignore_inputs)
+    clock = frames[0].clock
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    pending = [HAMMER_ROUNDS]
+    scheduled = []
+
+    def hammer() -> None:
+        for index, frame in enumerate(frames):
+            for call in range(HAMMER_CALLS):
+                match (index + call + pending[0]) % 3:
+                    case 0:
+                        frame.forward()
+                    case 1:
+                        frame.backward()
+                    case 2:
+                        frame.do_animation()
+            scheduled.append(len(clock._animations))
+        pending[0] -= 1
+        if pending[0] > 0:
+            backend.after(TOGGLE_INTERVAL, hammer)
+
+    hammer()
+    backend.run(lambda: pending[0] == 0 and all_terminated(frames)())
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="hammer", engine=engine, mode="step" if duration is None else "timed",
+        ignore_inputs=ignore_inputs, calls=count * HAMMER_CALLS * HAMMER_ROUNDS,
+        max_scheduled_steps=max(scheduled),
+        failures=[
+            f"{max(scheduled)} steps registered for {len(frames)} frames"
+        ] if max(scheduled) > len(frames) else [],
+    )
+
+
+def run_reuse(backend: Backend, engine: str, count: int, duration: Optional[float]) -> dict:
+    """
+    Instrumented frames whose pooled requests come back for the next ones.
+    Each round runs one animation to its end, one reversed before its first
+    step, one reversed mid-way and one cut short by low-power mode: five
+    timings per frame and round, one of them interrupted.
+    """
+    frames = CREATORS[engine](backend, count, duration, instrument=True)
+
+    def wait(delay: float) -> None:
+        stop = backend.now() + delay
+        backend.run(lambda: backend.now() >= stop)
+
+    def backward_in_low_power() -> None:
+        BaseFrame.low_power = True
+        try:
+            for frame in frames:
+                frame.backward()
+            backend.run(all_terminated(frames))
+        finally:
+            BaseFrame.low_power = False
+
+    backward_in_low_power()
+    initial = sum(frame.stats.requests for frame in frames)
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    for _ in range(REUSE_ROUNDS):
+        for frame in frames:
+            frame.forward()
+        backend.run(all_terminated(frames))
+        for frame in frames:
+            frame.backward()
+            frame.forward()
+        backend.run(all_terminated(frames))
+        for frame in frames:
+            frame.backward()
+        wait(HIDE_DELAY)
+        for frame in frames:
+            frame.forward()
+        backend.run(all_terminated(frames))
+        for frame in frames:
+            frame.backward()
+        wait(HIDE_DELAY)
+        backward_in_low_power()
+    timings = sum(frame.stats.requests for frame in frames) - initial
+    interrupted = sum(frame.stats.interrupted for frame in frames)
+    rounds = count * REUSE_ROUNDS
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="reuse", engine=engine, mode="step" if duration is None else "timed",
+        timings=timings, interrupted=interrupted,
+        failures=[
+            f"{timings} timings ({interrupted} interrupted) over {rounds} rounds"
+        ] if timings != 5 * rounds or interrupted != rounds else [],
+    )
+
+
+def run_property(backend: Backend, count: int, duration: Optional[float]) -> dict:
+    """ Frames tweening two colors and two numeric options of their own; a tick is one `configure` at most. """
+    frames = [backend.create(PropertyFrame, properties=PROPERTIES, duration=duration) for _ in range(count)]
+    backend.recorder.reset()
+    start, wakeups, ticks = backend.now(), backend.wakeups, len(backend.tick_times)
+    for frame in frames:
+        frame.forward()
+    backend.run(all_terminated(frames))
+    return _summary(
+        backend, frames, start, wakeups, ticks,
+        scenario="property", engine="property", mode="step" if duration is None else "timed",
+        properties=len(PROPERTIES),
+    )
+
+
+def scenarios():
+    for engine in CREATORS:
+        for duration in (None, DURATION):
+            for count in FRAME_COUNTS:
+                yield f"animation-{engine}-{count}", run_animation, engine, count, duration
+            for count in TOGGLE_FRAME_COUNTS:
+                yield f"toggle-{engine}-{count}", run_toggle, engine, count, duration
+            yield f"timeline-{engine}-{TIMELINE_FRAME_COUNT}", run_timeline, engine, TIMELINE_FRAME_COUNT, duration
+            for adaptive in (False, True):
+                name = f"overload-{engine}-{OVERLOAD_FRAME_COUNT}{'-adaptive' if adaptive else ''}"
+                yield name, run_overload, engine, OVERLOAD_FRAME_COUNT, duration, adaptive
+            for budget in (None, BUDGET):
+                name = f"budget-{engine}-{OVERLOAD_FRAME_COUNT}{'' if budget is None else f'-{budget}ms'}"
+                yield name, run_budget, engine, OVERLOAD_FRAME_COUNT, duration, budget
+    for duration in (None, DURATION):
+        for planning in (False, True):
+            name = f"pixels-slide-{PIXEL_FRAME_COUNT}{'-planned' if planning else ''}"
+            yield name, run_pixel_planning, PIXEL_FRAME_COUNT, duration, planning
+        yield f"window-resize-slide-{PIXEL_FRAME_COUNT}", run_window_resize, PIXEL_FRAME_COUNT, duration
+    for engine in CREATORS:
+        yield f"spring-{engine}-{SPRING_FRAME_COUNT}", run_spring, engine, SPRING_FRAME_COUNT
+    for engine in CREATORS:
+        for duration in (None, DURATION):
+            for how in ("iconify", "low-power"):
+                yield f"{how}-{engine}-100", run_hidden, engine, 100, duration, how
+    for duration in (None, DURATION):
+        for relayout_interval in (None, RELAYOUT_INTERVAL):
+            name = f"frozen-resize-{FROZEN_FRAME_COUNT}{'-relayout' if relayout_interval else ''}"
+            yield name, run_frozen, FROZEN_FRAME_COUNT, duration, relayout_interval
+    for engine in CREATORS:
+        for duration in (None, DURATION):
+            for ignore_inputs in (False, True):
+                name = f"hammer-{engine}-{HAMMER_FRAME_COUNT}{'-ignore-inputs' if ignore_inputs else ''}"
+                yield name, run_hammer, engine, HAMMER_FRAME_COUNT, duration, ignore_inputs
+    for engine in CREATORS:
+        for duration in (None, DURATION):
+            yield f"reuse-{engine}-{REUSE_FRAME_COUNT}", run_reuse, engine, REUSE_FRAME_COUNT, duration
+    for engine in CREATORS:
+        for duration in (None, DURATION):
+            yield f"lifecycle-{engine}-{LIFECYCLE_FRAME_COUNT}", run_lifecycle, engine, LIFECYCLE_FRAME_COUNT, duration
+    for engine in CREATORS:
+        for duration in (None, DURATION):
+            yield f"threaded-{engine}-{THREADED_FRAME_COUNT}", run_threaded, engine, THREADED_FRAME_COUNT, duration
+    for duration in (None, DURATION):
+        yield f"property-{PROPERTY_FRAME_COUNT}", run_property, PROPERTY_FRAME_COUNT, duration
+    for duration in (None, DURATION):
+        for count in CANVAS_ITEM_COUNTS:
+            yield f"canvas-{count}", run_canvas, count, duration